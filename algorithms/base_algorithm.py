@@ -1,32 +1,123 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import Iterator, List, Tuple, Union
+
+
+class StepDescription:
+    """
+    Step description that is formatted only when it is displayed.
+
+    Algorithms emit thousands of steps, most of which scroll by without
+    their text ever being read, so the template and its arguments are
+    stored and ``str()`` builds the final message on demand.
+    """
+
+    __slots__ = ("template", "args")
+
+    def __init__(self, template: str, *args):
+        self.template = template
+        self.args = args
+
+    def __str__(self) -> str:
+        return self.template.format(*self.args)
+
+    def __repr__(self) -> str:
+        return f"StepDescription({str(self)!r})"
+
+
+# A description is either a plain string or a lazily formatted one
+Description = Union[str, StepDescription]
+
+# One animation step: (action, indices, description). An "array_update" step
+# adds the array as it now stands as a fourth item, (..., snapshot).
+Step = Union[
+    Tuple[str, Tuple[int, ...], Description],
+    Tuple[str, Tuple[int, ...], Description, List[int]],
+]
+
+
+class IndexCache(dict):
+    """
+    Hands out one shared tuple per distinct combination of step indices.
+
+    Steps repeat the same few index pairs many times (every bubble sort
+    pass compares (0, 1), (1, 2), ...), so all of them can point at a
+    single immutable tuple instead of each holding its own list.
+    """
+
+    __slots__ = ()
+
+    def __call__(self, *indices: int) -> Tuple[int, ...]:
+        return self.setdefault(indices, indices)
 
 
 class SortingAlgorithm(ABC):
     """
     Abstract base class for sorting algorithms.
 
-    Each algorithm must implement methods to generate animation steps,
-    provide complexity information, and give a description.
+    Each algorithm must implement methods to generate and estimate its
+    animation steps and set its NAME, COMPLEXITY and DESCRIPTION class
+    attributes.
     """
 
+    # Fixed per algorithm, so subclasses set them once on the class instead
+    # of building them on every call
+    NAME: str
+    COMPLEXITY: Tuple[str, str]
+    DESCRIPTION: str
+
     @abstractmethod
-    def get_steps(self, arr: List[int]) -> List[Tuple[str, List[int], str]]:
+    def iter_steps(self, arr: List[int], *, copy: bool = True) -> Iterator[Step]:
         """
-        Generate animation steps for sorting the given array.
+        Lazily generate animation steps for sorting the given array.
+
+        Steps are produced one at a time as the sort runs, so the animation
+        can start before the whole sequence exists and never has to hold
+        all of it in memory.
 
         Args:
             arr: List of integers to sort
+            copy: Work on a copy of arr; pass False to sort arr in place and
+                skip the copy when the caller no longer needs the input order
 
-        Returns:
-            List of tuples in format (action, indices, description) where:
+        Yields:
+            Tuples in format (action, indices, description) where:
             - action: 'compare', 'swap', 'mark_sorted', 'highlight_pivot', etc.
-            - indices: List of array indices involved in the action
-            - description: Human-readable description of the current step
+            - indices: Tuple of array indices involved in the action
+            - description: Human-readable description of the current step,
+              either a string or a StepDescription formatted with str()
+            "array_update" steps carry a fourth item, a snapshot of the
+            array after the update, for the canvas to show as is.
         """
         pass
 
+    def get_steps(self, arr: List[int], *, copy: bool = True) -> List[Step]:
+        """
+        Generate all animation steps for sorting the given array.
+
+        Args:
+            arr: List of integers to sort
+            copy: Work on a copy of arr; pass False to sort arr in place
+
+        Returns:
+            List of the steps produced by iter_steps()
+        """
+        return list(self.iter_steps(arr, copy=copy))
+
     @abstractmethod
+    def estimate_step_count(self, n: int) -> int:
+        """
+        Estimate how many steps sorting an array of n elements produces.
+
+        Used to show progress while steps are still being generated.
+
+        Args:
+            n: Number of elements in the array
+
+        Returns:
+            Approximate number of steps
+        """
+        pass
+
     def get_complexity(self) -> Tuple[str, str]:
         """
         Get the time and space complexity of the algorithm.
@@ -34,9 +125,8 @@ class SortingAlgorithm(ABC):
         Returns:
             Tuple of (time_complexity, space_complexity) as strings
         """
-        pass
+        return self.COMPLEXITY
 
-    @abstractmethod
     def get_description(self) -> str:
         """
         Get a brief description of how the algorithm works.
@@ -44,9 +134,8 @@ class SortingAlgorithm(ABC):
         Returns:
             String description of the algorithm
         """
-        pass
+        return self.DESCRIPTION
 
-    @abstractmethod
     def get_name(self) -> str:
         """
         Get the name of the algorithm.
@@ -54,7 +143,7 @@ class SortingAlgorithm(ABC):
         Returns:
             String name of the algorithm
         """
-        pass
+        return self.NAME
 
     def sort_array(self, arr: List[int]) -> List[int]:
         """
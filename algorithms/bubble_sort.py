@@ -1,5 +1,15 @@
-from typing import List, Tuple
-from .base_algorithm import SortingAlgorithm
+from typing import Iterator, List
+from .base_algorithm import (
+    SortingAlgorithm,
+    StepDescription,
+    IndexCache,
+    Step,
+)
+
+_COMPARING = "Comparing {} and {}"
+_SWAPPING = "Swapping {} and {}"
+_PASS_SORTED = "Element {} is now in correct position"
+_ALREADY_SORTED = "Element {} is in correct position"
 
 
 class BubbleSort(SortingAlgorithm):
@@ -10,68 +20,57 @@ class BubbleSort(SortingAlgorithm):
     Process repeats until no more swaps are needed.
     """
 
-    def get_name(self) -> str:
-        return "Bubble Sort"
+    NAME = "Bubble Sort"
+    COMPLEXITY = ("O(n²)", "O(1)")
+    DESCRIPTION = "Compares adjacent elements and swaps them if they are in wrong order. Repeats until no swaps are needed."
 
-    def get_steps(self, arr: List[int]) -> List[Tuple[str, List[int], str]]:
+    def iter_steps(self, arr: List[int], *, copy: bool = True) -> Iterator[Step]:
         """Generate animation steps for bubble sort."""
-        steps = []
-        arr_copy = arr.copy()
+        # Bind hot-loop lookups to locals once instead of per step
+        describe = StepDescription
+        idx = IndexCache()
+        arr_copy = arr.copy() if copy else arr
         n = len(arr_copy)
 
         for i in range(n):
             swapped = False
 
+            # The larger value of each pair ends up at j + 1, so carry it into
+            # the next comparison instead of reading it back from the list
+            left = arr_copy[0]
             for j in range(0, n - i - 1):
+                right = arr_copy[j + 1]
+                pair = idx(j, j + 1)
+
                 # Compare adjacent elements
-                steps.append(
-                    (
-                        "compare",
-                        [j, j + 1],
-                        f"Comparing {arr_copy[j]} and {arr_copy[j + 1]}",
-                    )
-                )
+                yield ("compare", pair, describe(_COMPARING, left, right))
 
-                if arr_copy[j] > arr_copy[j + 1]:
+                if left > right:
                     # Swap elements
-                    steps.append(
-                        (
-                            "swap",
-                            [j, j + 1],
-                            f"Swapping {arr_copy[j]} and {arr_copy[j + 1]}",
-                        )
-                    )
-                    arr_copy[j], arr_copy[j + 1] = arr_copy[j + 1], arr_copy[j]
+                    yield ("swap", pair, describe(_SWAPPING, left, right))
+                    arr_copy[j], arr_copy[j + 1] = right, left
                     swapped = True
+                else:
+                    left = right
 
             # Mark the last element as sorted after each pass
-            steps.append(
-                (
-                    "mark_sorted",
-                    [n - i - 1],
-                    f"Element {arr_copy[n - i - 1]} is now in correct position",
-                )
+            yield (
+                "mark_sorted",
+                idx(n - i - 1),
+                describe(_PASS_SORTED, arr_copy[n - i - 1]),
             )
 
             # If no swapping occurred, the array is sorted
             if not swapped:
                 # Mark all remaining elements as sorted
                 for k in range(n - i - 1):
-                    steps.append(
-                        (
-                            "mark_sorted",
-                            [k],
-                            f"Element {arr_copy[k]} is in correct position",
-                        )
+                    yield (
+                        "mark_sorted",
+                        idx(k),
+                        describe(_ALREADY_SORTED, arr_copy[k]),
                     )
                 break
 
-        return steps
-
-    def get_complexity(self) -> Tuple[str, str]:
-        """Return time and space complexity."""
-        return ("O(n²)", "O(1)")
-
-    def get_description(self) -> str:
-        """Return algorithm description."""
-        return "Compares adjacent elements and swaps them if they are in wrong order. Repeats until no swaps are needed."
+    def estimate_step_count(self, n: int) -> int:
+        """Return the worst case: every pair compared and swapped, plus marks."""
+        return n * n
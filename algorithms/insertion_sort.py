@@ -1,5 +1,18 @@
-from typing import List, Tuple
-from .base_algorithm import SortingAlgorithm
+from typing import Iterator, List
+from .base_algorithm import (
+    SortingAlgorithm,
+    StepDescription,
+    IndexCache,
+    Step,
+)
+
+_INITIALLY_SORTED = "Element {} at position 0 is initially sorted"
+_INSERTING = "Inserting element {} into sorted portion"
+_COMPARING = "Comparing {} with {}"
+_MOVING = "Moving {} one position right"
+_ARRAY_UPDATED = "Array updated: {}"
+_INSERTING_AT = "Inserting {} at position {}"
+_SORTED_PORTION = "Position {} is now in sorted portion"
 
 
 class InsertionSort(SortingAlgorithm):
@@ -10,77 +23,65 @@ class InsertionSort(SortingAlgorithm):
     of the array, similar to sorting playing cards in hand.
     """
 
-    def get_name(self) -> str:
-        return "Insertion Sort"
+    NAME = "Insertion Sort"
+    COMPLEXITY = ("O(n²)", "O(1)")
+    DESCRIPTION = "Inserts each element into its correct position in the sorted portion of the array."
 
-    def get_steps(self, arr: List[int]) -> List[Tuple[str, List[int], str]]:
+    def iter_steps(self, arr: List[int], *, copy: bool = True) -> Iterator[Step]:
         """Generate animation steps for insertion sort."""
-        steps = []
-        arr_copy = arr.copy()
+        # Bind hot-loop lookups to locals once instead of per step
+        describe = StepDescription
+        idx = IndexCache()
+        arr_copy = arr.copy() if copy else arr
         n = len(arr_copy)
 
         # Handle empty array
         if n == 0:
-            return steps
+            return
+
+        # Every array_update step covers the whole array; share one tuple
+        all_indices = tuple(range(n))
 
         # First element is considered sorted
-        steps.append(
-            (
-                "mark_sorted",
-                [0],
-                f"Element {arr_copy[0]} at position 0 is initially sorted",
-            )
-        )
+        yield ("mark_sorted", idx(0), describe(_INITIALLY_SORTED, arr_copy[0]))
 
         for i in range(1, n):
             key = arr_copy[i]
-            steps.append(
-                (
-                    "highlight_current",
-                    [i],
-                    f"Inserting element {key} into sorted portion",
-                )
-            )
+            yield ("highlight_current", idx(i), describe(_INSERTING, key))
 
             j = i - 1
 
-            # Move elements that are greater than key one position ahead
-            while j >= 0 and arr_copy[j] > key:
-                steps.append(("compare", [j, i], f"Comparing {arr_copy[j]} with {key}"))
-                steps.append(
-                    ("shift", [j, j + 1], f"Moving {arr_copy[j]} one position right")
-                )
+            # Move elements that are greater than key one position ahead,
+            # reading each one from the list only once
+            while j >= 0:
+                value = arr_copy[j]
+                if value <= key:
+                    break
+                yield ("compare", idx(j, i), describe(_COMPARING, value, key))
+                yield ("shift", idx(j, j + 1), describe(_MOVING, value))
 
-                arr_copy[j + 1] = arr_copy[j]
+                arr_copy[j + 1] = value
                 j -= 1
 
             # Place key at its correct position
             if j + 1 != i:
                 arr_copy[j + 1] = key
-                steps.append(
-                    (
-                        "array_update",
-                        list(range(len(arr_copy))),
-                        f"Array updated: {arr_copy}",
-                    )
-                )
-                steps.append(
-                    ("insert", [j + 1], f"Inserting {key} at position {j + 1}")
+                # Snapshot the array; it keeps changing after this step
+                snapshot = arr_copy.copy()
+                yield (
+                    "array_update",
+                    all_indices,
+                    describe(_ARRAY_UPDATED, snapshot),
+                    snapshot,
                 )
+                yield ("insert", idx(j + 1), describe(_INSERTING_AT, key, j + 1))
 
-            # Mark the newly sorted portion
-            for k in range(i + 1):
-                if k <= i:
-                    steps.append(
-                        ("mark_sorted", [k], f"Position {k} is now in sorted portion")
-                    )
+            # Positions before i were marked on earlier passes; only the
+            # frontier of the sorted portion advances
+            yield ("mark_sorted", idx(i), describe(_SORTED_PORTION, i))
 
-        return steps
-
-    def get_complexity(self) -> Tuple[str, str]:
-        """Return time and space complexity."""
-        return ("O(n²)", "O(1)")
-
-    def get_description(self) -> str:
-        """Return algorithm description."""
-        return "Inserts each element into its correct position in the sorted portion of the array."
+    def estimate_step_count(self, n: int) -> int:
+        """Return the worst case: every element shifted all the way left."""
+        if n == 0:
+            return 0
+        return 1 + n * (n - 1) + 4 * (n - 1)
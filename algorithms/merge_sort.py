@@ -1,138 +1,146 @@
-from typing import List, Tuple
-from .base_algorithm import SortingAlgorithm
+from bisect import bisect_left, bisect_right
+from math import ceil, log2
+from typing import Iterator, List
+from .base_algorithm import (
+    SortingAlgorithm,
+    StepDescription,
+    IndexCache,
+    Step,
+)
+
+_RUN_FOUND = "Found sorted run [{}..{}]"
+_REVERSING = "Reversing descending run: swapping {} and {}"
+_MERGING = "Merging sorted subarrays [{}..{}] and [{}..{}]"
+_PLACING = "Placing {} at position {}"
+_PLACING_REMAINING = "Placing remaining {} at position {}"
+_ARRAY_UPDATED = "Array updated: {}"
+_MERGED_SORTED = "Merged section [{}..{}] is now sorted"
 
 
 class MergeSort(SortingAlgorithm):
     """
     Merge Sort implementation with step-by-step animation support.
 
-    Divides array into halves, sorts them recursively, then merges
-    the sorted halves back together.
+    Runs bottom-up like Timsort: it first splits the array into the runs
+    that are already in order, reversing descending ones, then merges
+    neighbouring runs until one is left, so partly sorted input needs far
+    fewer merges and sorted input none at all.
     """
 
-    def get_name(self) -> str:
-        return "Merge Sort"
+    NAME = "Merge Sort"
+    COMPLEXITY = ("O(n log n)", "O(n)")
+    DESCRIPTION = "Finds the runs that are already in order, then merges neighbouring runs until one sorted run is left."
 
-    def get_steps(self, arr: List[int]) -> List[Tuple[str, List[int], str]]:
+    def iter_steps(self, arr: List[int], *, copy: bool = True) -> Iterator[Step]:
         """Generate animation steps for merge sort."""
-        steps = []
-        arr_copy = arr.copy()
-
-        def merge_sort_helper(left: int, right: int):
-            if left >= right:
-                # Base case: single element or empty, mark as sorted
-                if left == right:
-                    steps.append(
-                        (
-                            "mark_sorted",
-                            [left],
-                            f"Single element {arr_copy[left]} is already sorted",
-                        )
-                    )
-                return
-
-            if left < right:
-                mid = (left + right) // 2
-
-                # Divide phase
-                steps.append(
-                    (
-                        "divide",
-                        [left, mid, right],
-                        f"Dividing array from {left} to {right} at position {mid}",
-                    )
-                )
-
-                # Recursively sort both halves
-                merge_sort_helper(left, mid)
-                merge_sort_helper(mid + 1, right)
-
-                # Merge phase
-                merge(left, mid, right)
-
-        def merge(left: int, mid: int, right: int):
+        # Bind hot-loop lookups to locals once instead of per step
+        describe = StepDescription
+        idx = IndexCache()
+        arr_copy = arr.copy() if copy else arr
+        # Every array_update step covers the whole array; share one tuple
+        all_indices = tuple(range(len(arr_copy)))
+
+        def merge(left: int, mid: int, right: int) -> Iterator[Step]:
             # Create temporary arrays for left and right subarrays
             left_arr = arr_copy[left : mid + 1]
             right_arr = arr_copy[mid + 1 : right + 1]
 
-            steps.append(
-                (
-                    "merge_start",
-                    [left, mid, right],
-                    f"Merging sorted subarrays [{left}..{mid}] and [{mid + 1}..{right}]",
-                )
+            yield (
+                "merge_start",
+                idx(left, mid, right),
+                describe(_MERGING, left, mid, mid + 1, right),
             )
 
-            i = j = 0
-            k = left
+            # Ties go to the left run, so the stable built-in sort yields the
+            # merged order in a single linear pass over the two sorted runs
+            merged = sorted(left_arr + right_arr)
+
+            # Whichever run ends with the smaller value runs out first; after
+            # that the rest of the other run is copied over unchanged
+            if left_arr[-1] <= right_arr[-1]:
+                exhausted = len(left_arr) + bisect_left(right_arr, left_arr[-1])
+            else:
+                exhausted = len(right_arr) + bisect_right(left_arr, right_arr[-1])
+
+            # Each placement already shows where the winner of a comparison
+            # goes, so no separate compare step is emitted for it
+            for offset, value in enumerate(merged):
+                k = left + offset
+                if offset < exhausted:
+                    yield ("place", idx(k), describe(_PLACING, value, k))
+                else:
+                    yield ("place", idx(k), describe(_PLACING_REMAINING, value, k))
 
-            # Merge the temporary arrays back into arr_copy[left..right]
-            while i < len(left_arr) and j < len(right_arr):
-                steps.append(
-                    (
-                        "compare",
-                        [left + i, mid + 1 + j],
-                        f"Comparing {left_arr[i]} and {right_arr[j]}",
-                    )
-                )
+            arr_copy[left : right + 1] = merged
 
-                if left_arr[i] <= right_arr[j]:
-                    arr_copy[k] = left_arr[i]
-                    steps.append(
-                        ("place", [k], f"Placing {left_arr[i]} at position {k}")
-                    )
-                    i += 1
-                else:
-                    arr_copy[k] = right_arr[j]
-                    steps.append(
-                        ("place", [k], f"Placing {right_arr[j]} at position {k}")
-                    )
-                    j += 1
-                k += 1
-
-            # Copy remaining elements of left_arr, if any
-            while i < len(left_arr):
-                arr_copy[k] = left_arr[i]
-                steps.append(
-                    ("place", [k], f"Placing remaining {left_arr[i]} at position {k}")
-                )
-                i += 1
-                k += 1
-
-            # Copy remaining elements of right_arr, if any
-            while j < len(right_arr):
-                arr_copy[k] = right_arr[j]
-                steps.append(
-                    ("place", [k], f"Placing remaining {right_arr[j]} at position {k}")
-                )
-                j += 1
-                k += 1
-
-            # Update array state after merge
-            steps.append(
-                (
-                    "array_update",
-                    list(range(len(arr_copy))),
-                    f"Array updated: {arr_copy}",
-                )
+            # Update array state after merge; snapshot it since merging continues
+            snapshot = arr_copy.copy()
+            yield (
+                "array_update",
+                all_indices,
+                describe(_ARRAY_UPDATED, snapshot),
+                snapshot,
             )
 
             # Mark merged section as sorted
-            steps.append(
-                (
-                    "mark_sorted",
-                    list(range(left, right + 1)),
-                    f"Merged section [{left}..{right}] is now sorted",
-                )
+            yield (
+                "mark_sorted",
+                tuple(range(left, right + 1)),
+                describe(_MERGED_SORTED, left, right),
             )
 
-        merge_sort_helper(0, len(arr_copy) - 1)
-        return steps
-
-    def get_complexity(self) -> Tuple[str, str]:
-        """Return time and space complexity."""
-        return ("O(n log n)", "O(n)")
-
-    def get_description(self) -> str:
-        """Return algorithm description."""
-        return "Divides array into halves, sorts them recursively, then merges the sorted halves back together."
+        n = len(arr_copy)
+
+        # Split the array into maximal runs that are already in order.
+        # Strictly descending runs are reversed in place; requiring strict
+        # order keeps equal elements from swapping, so the sort stays stable.
+        runs = []
+        start = 0
+        while start < n:
+            end = start + 1
+            if end < n and arr_copy[end] < arr_copy[start]:
+                while end < n and arr_copy[end] < arr_copy[end - 1]:
+                    end += 1
+                low, high = start, end - 1
+                while low < high:
+                    yield (
+                        "swap",
+                        idx(low, high),
+                        describe(_REVERSING, arr_copy[low], arr_copy[high]),
+                    )
+                    arr_copy[low], arr_copy[high] = arr_copy[high], arr_copy[low]
+                    low += 1
+                    high -= 1
+            else:
+                while end < n and arr_copy[end] >= arr_copy[end - 1]:
+                    end += 1
+
+            yield (
+                "run_detected",
+                tuple(range(start, end)),
+                describe(_RUN_FOUND, start, end - 1),
+            )
+            runs.append((start, end - 1))
+            start = end
+
+        # Merge neighbouring runs pairwise until a single run remains
+        while len(runs) > 1:
+            merged_runs = []
+            for k in range(0, len(runs) - 1, 2):
+                left, mid = runs[k]
+                right = runs[k + 1][1]
+                yield from merge(left, mid, right)
+                merged_runs.append((left, right))
+            if len(runs) % 2:
+                merged_runs.append(runs[-1])
+            runs = merged_runs
+
+    def estimate_step_count(self, n: int) -> int:
+        """
+        Return an upper bound: at most a step per element while finding
+        runs, a place per element on each level of merging, and three
+        bookkeeping steps for each of the at most n - 1 merges.
+        """
+        if n < 2:
+            return n
+        return n + n * ceil(log2(n)) + 3 * (n - 1)
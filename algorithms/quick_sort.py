@@ -1,98 +1,224 @@
-from typing import List, Tuple
-from .base_algorithm import SortingAlgorithm
+from math import log2
+from typing import Generator, Iterator, List, Tuple
+from .base_algorithm import (
+    SortingAlgorithm,
+    StepDescription,
+    IndexCache,
+    Step,
+)
+
+# Partitions of at most this many elements are finished with insertion sort.
+# Kept below the usual 16 so the 10-50 element arrays shown in the UI still
+# visibly partition.
+_INSERTION_CUTOFF = 6
+
+# Partitions larger than this pick their pivot as a median of nine
+_NINTHER_CUTOFF = 40
+
+_PIVOT_SORTED = "Pivot {} is now in correct position"
+_EQUAL_SORTED = "Pivot {} and its equal values are now in positions {}..{}"
+_CHOOSING_PIVOT = "Choosing {} as pivot (median of three)"
+_CHOOSING_NINTHER = "Choosing {} as pivot (median of nine)"
+_MOVING_PIVOT = "Moving pivot {} to the end of the partition"
+_COMPARING_RANGE = "Comparing elements {}..{} with pivot {}"
+_SWAPPING = "Swapping {} and {}"
+_PLACING_PIVOT = "Placing pivot {} in correct position"
+_INSERTION_COMPARING = "Comparing {} and {}"
+_INSERTION_SORTED = "Small partition [{}..{}] sorted by insertion"
 
 
 class QuickSort(SortingAlgorithm):
     """
     Quick Sort implementation with step-by-step animation support.
 
-    Partitions array around a pivot element, then sorts the partitions
-    recursively. Uses last element as pivot.
+    Partitions array around a pivot element, then sorts the partitions.
+    Uses a median-of-three pivot (median of nine for large partitions) and
+    an explicit stack instead of recursion, and finishes small partitions
+    with insertion sort. Values equal to the pivot are gathered next to it
+    and never partitioned again, so inputs with many duplicates stay
+    O(n log n).
     """
 
-    def get_name(self) -> str:
-        return "Quick Sort"
+    NAME = "Quick Sort"
+    COMPLEXITY = ("O(n log n)", "O(log n)")
+    DESCRIPTION = "Partitions array around a median-of-three pivot, works through the partitions with a stack, and finishes small ones with insertion sort."
 
-    def get_steps(self, arr: List[int]) -> List[Tuple[str, List[int], str]]:
+    def iter_steps(self, arr: List[int], *, copy: bool = True) -> Iterator[Step]:
         """Generate animation steps for quick sort."""
-        steps = []
-        arr_copy = arr.copy()
-
-        def quick_sort_helper(low: int, high: int):
-            if low < high:
-                # Partition the array and get pivot index
-                pivot_idx = partition(low, high)
-
-                # Mark pivot as in correct position
-                steps.append(
-                    (
-                        "mark_sorted",
-                        [pivot_idx],
-                        f"Pivot {arr_copy[pivot_idx]} is now in correct position",
+        # Bind hot-loop lookups to locals once instead of per step
+        describe = StepDescription
+        idx = IndexCache()
+        arr_copy = arr.copy() if copy else arr
+
+        def insertion_sort(low: int, high: int) -> Iterator[Step]:
+            # Insert each element by adjacent swaps so the canvas can animate them
+            for i in range(low + 1, high + 1):
+                # The inserted value travels down with each swap, so only its
+                # left neighbour has to be read from the list
+                value = arr_copy[i]
+                j = i
+                while j > low:
+                    previous = arr_copy[j - 1]
+                    pair = idx(j - 1, j)
+                    yield (
+                        "compare",
+                        pair,
+                        describe(_INSERTION_COMPARING, previous, value),
                     )
+                    if previous <= value:
+                        break
+                    yield ("swap", pair, describe(_SWAPPING, previous, value))
+                    arr_copy[j - 1], arr_copy[j] = value, previous
+                    j -= 1
+
+            yield (
+                "mark_sorted",
+                tuple(range(low, high + 1)),
+                describe(_INSERTION_SORTED, low, high),
+            )
+
+        def median_of_three(a: int, b: int, c: int) -> int:
+            x, y, z = arr_copy[a], arr_copy[b], arr_copy[c]
+            if x <= y:
+                if y <= z:
+                    return b
+                return c if x <= z else a
+            if x <= z:
+                return a
+            return c if y <= z else b
+
+        def partition(low: int, high: int) -> Generator[Step, None, Tuple[int, int]]:
+            # Move the median of three to the end and use it as pivot. Large
+            # partitions take the median of three such medians, spread over
+            # the partition, which organ-pipe input can't steer to an extreme.
+            mid = (low + high) // 2
+            if high - low + 1 <= _NINTHER_CUTOFF:
+                pivot_idx = median_of_three(low, mid, high)
+                choosing = _CHOOSING_PIVOT
+            else:
+                step = (high - low) // 8
+                pivot_idx = median_of_three(
+                    median_of_three(low, low + step, low + 2 * step),
+                    median_of_three(mid - step, mid, mid + step),
+                    median_of_three(high - 2 * step, high - step, high),
+                )
+                choosing = _CHOOSING_NINTHER
+            pivot = arr_copy[pivot_idx]
+            yield ("highlight_pivot", idx(pivot_idx), describe(choosing, pivot))
+            if pivot_idx != high:
+                yield ("swap", idx(pivot_idx, high), describe(_MOVING_PIVOT, pivot))
+                arr_copy[pivot_idx], arr_copy[high] = (
+                    arr_copy[high],
+                    arr_copy[pivot_idx],
                 )
 
-                # Recursively sort elements before and after partition
-                quick_sort_helper(low, pivot_idx - 1)
-                quick_sort_helper(pivot_idx + 1, high)
-
-        def partition(low: int, high: int) -> int:
-            # Choose rightmost element as pivot
-            pivot = arr_copy[high]
-            steps.append(("highlight_pivot", [high], f"Choosing {pivot} as pivot"))
+            # Every element of the partition is compared against the same
+            # pivot, so show the whole span in one step rather than one step
+            # per comparison
+            yield (
+                "compare_range",
+                idx(low, high - 1, high),
+                describe(_COMPARING_RANGE, low, high - 1, pivot),
+            )
 
-            # Index of smaller element (indicates right position of pivot)
-            i = low - 1
+            # Three-way partition: low..lt-1 holds smaller values, lt..eq-1
+            # values equal to the pivot and eq..j-1 larger values. Setting
+            # equal keys apart keeps them from all landing on one side.
+            lt = eq = low
 
             for j in range(low, high):
-                # Compare current element with pivot
-                steps.append(
-                    (
-                        "compare",
-                        [j, high],
-                        f"Comparing {arr_copy[j]} with pivot {pivot}",
-                    )
-                )
-
-                # If current element is smaller than or equal to pivot
-                if arr_copy[j] <= pivot:
-                    i += 1
-                    if i != j:
-                        steps.append(
-                            (
-                                "swap",
-                                [i, j],
-                                f"Swapping {arr_copy[i]} and {arr_copy[j]}",
-                            )
+                value = arr_copy[j]
+
+                if value < pivot:
+                    # Move the first larger value to j, then the first equal
+                    # one to the end of the equal values, opening a slot at lt
+                    if eq != j:
+                        yield (
+                            "swap",
+                            idx(eq, j),
+                            describe(_SWAPPING, arr_copy[eq], value),
                         )
-                        arr_copy[i], arr_copy[j] = arr_copy[j], arr_copy[i]
-
-            # Place pivot in correct position
-            if i + 1 != high:
-                steps.append(
-                    (
-                        "swap",
-                        [i + 1, high],
-                        f"Placing pivot {pivot} in correct position",
-                    )
+                        arr_copy[eq], arr_copy[j] = value, arr_copy[eq]
+                    if lt != eq:
+                        yield (
+                            "swap",
+                            idx(lt, eq),
+                            describe(_SWAPPING, arr_copy[lt], value),
+                        )
+                        arr_copy[lt], arr_copy[eq] = value, arr_copy[lt]
+                    lt += 1
+                    eq += 1
+                elif value == pivot:
+                    if eq != j:
+                        yield (
+                            "swap",
+                            idx(eq, j),
+                            describe(_SWAPPING, arr_copy[eq], value),
+                        )
+                        arr_copy[eq], arr_copy[j] = value, arr_copy[eq]
+                    eq += 1
+
+            # Place pivot right after the values equal to it
+            if eq != high:
+                yield (
+                    "swap",
+                    idx(eq, high),
+                    describe(_PLACING_PIVOT, pivot),
+                )
+                arr_copy[eq], arr_copy[high] = arr_copy[high], arr_copy[eq]
+
+            return lt, eq
+
+        # Explicit stack of (low, high) ranges still to sort
+        stack = [(0, len(arr_copy) - 1)]
+        while stack:
+            low, high = stack.pop()
+            if low >= high:
+                continue
+
+            if high - low + 1 <= _INSERTION_CUTOFF:
+                yield from insertion_sort(low, high)
+                continue
+
+            # Partition the array and get the span holding the pivot's value
+            first, last = yield from partition(low, high)
+
+            # Mark the pivot, and any values equal to it, as in correct position
+            if first == last:
+                yield (
+                    "mark_sorted",
+                    idx(first),
+                    describe(_PIVOT_SORTED, arr_copy[first]),
+                )
+            else:
+                yield (
+                    "mark_sorted",
+                    tuple(range(first, last + 1)),
+                    describe(_EQUAL_SORTED, arr_copy[first], first, last),
                 )
-                arr_copy[i + 1], arr_copy[high] = arr_copy[high], arr_copy[i + 1]
-
-            return i + 1
 
-        quick_sort_helper(0, len(arr_copy) - 1)
+            # Push the larger side first so the smaller one is handled next,
+            # which keeps the stack depth at O(log n)
+            left, right = (low, first - 1), (last + 1, high)
+            if left[1] - left[0] > right[1] - right[0]:
+                stack.append(left)
+                stack.append(right)
+            else:
+                stack.append(right)
+                stack.append(left)
 
         # Mark all elements as sorted at the end
-        steps.append(
-            ("mark_sorted", list(range(len(arr_copy))), "All elements are now sorted")
+        yield (
+            "mark_sorted",
+            tuple(range(len(arr_copy))),
+            "All elements are now sorted",
         )
 
-        return steps
-
-    def get_complexity(self) -> Tuple[str, str]:
-        """Return time and space complexity."""
-        return ("O(n log n)", "O(log n)")
-
-    def get_description(self) -> str:
-        """Return algorithm description."""
-        return "Partitions array around a pivot element, then sorts the partitions recursively."
+    def estimate_step_count(self, n: int) -> int:
+        """
+        Return the typical count for distinct values in random order. Values
+        equal to a pivot are settled with it, so duplicates only lower this.
+        """
+        if n < 2:
+            return n
+        return round(0.75 * n * log2(n))
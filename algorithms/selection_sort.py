@@ -1,5 +1,16 @@
-from typing import List, Tuple
-from .base_algorithm import SortingAlgorithm
+from typing import Iterator, List
+from .base_algorithm import (
+    SortingAlgorithm,
+    StepDescription,
+    IndexCache,
+    Step,
+)
+
+_FINDING_MIN = "Finding minimum element from position {}"
+_COMPARING = "Comparing {} with {}"
+_NEW_MIN = "New minimum found: {} at position {}"
+_SWAPPING = "Swapping {} with minimum {}"
+_SORTED = "Element {} is now in correct position"
 
 
 class SelectionSort(SortingAlgorithm):
@@ -10,68 +21,55 @@ class SelectionSort(SortingAlgorithm):
     at the beginning of the unsorted portion.
     """
 
-    def get_name(self) -> str:
-        return "Selection Sort"
+    NAME = "Selection Sort"
+    COMPLEXITY = ("O(n²)", "O(1)")
+    DESCRIPTION = "Finds the minimum element from the unsorted portion and places it at the beginning."
 
-    def get_steps(self, arr: List[int]) -> List[Tuple[str, List[int], str]]:
+    def iter_steps(self, arr: List[int], *, copy: bool = True) -> Iterator[Step]:
         """Generate animation steps for selection sort."""
-        steps = []
-        arr_copy = arr.copy()
+        # Bind hot-loop lookups to locals once instead of per step
+        describe = StepDescription
+        idx = IndexCache()
+        arr_copy = arr.copy() if copy else arr
         n = len(arr_copy)
 
         for i in range(n):
-            # Find minimum element in remaining unsorted array
+            # Find minimum element in remaining unsorted array, keeping its
+            # value alongside its index so it is never read back from the list
             min_idx = i
-            steps.append(
-                ("highlight_current", [i], f"Finding minimum element from position {i}")
-            )
+            min_value = arr_copy[i]
+            yield ("highlight_current", idx(i), describe(_FINDING_MIN, i))
 
             for j in range(i + 1, n):
+                value = arr_copy[j]
+
                 # Compare current element with minimum
-                steps.append(
-                    (
-                        "compare",
-                        [min_idx, j],
-                        f"Comparing {arr_copy[min_idx]} with {arr_copy[j]}",
-                    )
+                yield (
+                    "compare",
+                    idx(min_idx, j),
+                    describe(_COMPARING, min_value, value),
                 )
 
-                if arr_copy[j] < arr_copy[min_idx]:
-                    min_idx = j
-                    steps.append(
-                        (
-                            "highlight_min",
-                            [min_idx],
-                            f"New minimum found: {arr_copy[min_idx]} at position {min_idx}",
-                        )
-                    )
+                if value < min_value:
+                    min_idx, min_value = j, value
+                    yield ("highlight_min", idx(j), describe(_NEW_MIN, value, j))
 
             # Swap the found minimum element with the first element
             if min_idx != i:
-                steps.append(
-                    (
-                        "swap",
-                        [i, min_idx],
-                        f"Swapping {arr_copy[i]} with minimum {arr_copy[min_idx]}",
-                    )
+                current = arr_copy[i]
+                yield (
+                    "swap",
+                    idx(i, min_idx),
+                    describe(_SWAPPING, current, min_value),
                 )
-                arr_copy[i], arr_copy[min_idx] = arr_copy[min_idx], arr_copy[i]
+                arr_copy[i], arr_copy[min_idx] = min_value, current
 
             # Mark current position as sorted
-            steps.append(
-                (
-                    "mark_sorted",
-                    [i],
-                    f"Element {arr_copy[i]} is now in correct position",
-                )
-            )
-
-        return steps
-
-    def get_complexity(self) -> Tuple[str, str]:
-        """Return time and space complexity."""
-        return ("O(n²)", "O(1)")
+            yield ("mark_sorted", idx(i), describe(_SORTED, min_value))
 
-    def get_description(self) -> str:
-        """Return algorithm description."""
-        return "Finds the minimum element from the unsorted portion and places it at the beginning."
+    def estimate_step_count(self, n: int) -> int:
+        """
+        Return the worst case: every pair compared with a new minimum each
+        time, plus highlight, swap and mark per position.
+        """
+        return n * n + 2 * n
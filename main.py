@@ -10,7 +10,7 @@ from tkinter import messagebox
 import sys
 import time
 import logging
-from typing import Optional
+from typing import Optional, Sequence
 
 from algorithms import ALGORITHMS
 from ui import ControlPanel, VisualizationCanvas, LegendPanel
@@ -63,6 +63,7 @@ class SortingVisualizerApp:
         )
         self.animation_controller.set_step_callback(self.on_step_change)
         self.animation_controller.set_completion_callback(self.on_animation_complete)
+        self.animation_controller.set_error_callback(self.on_animation_error)
 
         # Connect panel callbacks
         self.setup_callbacks()
@@ -170,11 +171,14 @@ class SortingVisualizerApp:
             return
 
         try:
-            # Generate animation steps
-            steps = self.current_algorithm_instance.get_steps(self.current_array)
+            # Stream animation steps so playback starts without generating
+            # the whole sequence first
+            algorithm = self.current_algorithm_instance
+            steps = algorithm.iter_steps(self.current_array)
+            estimated_steps = algorithm.estimate_step_count(len(self.current_array))
 
             # Set up animation
-            self.animation_controller.set_steps(steps)
+            self.animation_controller.set_steps(steps, estimated_steps)
             self.animation_start_time = time.time()
 
             # Clear previous messages
@@ -183,13 +187,13 @@ class SortingVisualizerApp:
             # Start animation
             self.animation_controller.play()
 
-            logger.info(f"Started {self.current_algorithm} animation with {len(steps)} steps")
+            logger.info(
+                f"Started {self.current_algorithm} animation "
+                f"with about {estimated_steps} steps"
+            )
 
         except Exception as e:
-            messagebox.showerror(
-                "Animation Error", f"Failed to start animation: {str(e)}"
-            )
-            logger.error(f"Animation error: {e}")
+            self.on_animation_error(e)
 
     def on_pause(self):
         """Handle pause button click."""
@@ -217,7 +221,7 @@ class SortingVisualizerApp:
     def on_animation_update(
         self,
         action: str,
-        indices: list,
+        indices: Sequence[int],
         description: str,
         animation_data: Optional[dict] = None,
     ):
@@ -256,6 +260,11 @@ class SortingVisualizerApp:
 
         logger.info(f"Animation completed in {animation_time:.2f}s with {total} steps")
 
+    def on_animation_error(self, error: Exception):
+        """Handle an error raised while starting or running the animation."""
+        messagebox.showerror("Animation Error", f"Animation failed: {error}")
+        logger.error(f"Animation error: {error}")
+
     def on_closing(self):
         """Handle application closing."""
         # Clean up animation controller
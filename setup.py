@@ -2,7 +2,7 @@
 Setup script for Algorithm Visualizer
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
@@ -16,7 +16,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/Rblea97/Algorithm-Visualizer",
-    packages=find_packages(),
+    packages=["algorithms", "ui", "utils"],
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Education",
@@ -4,6 +4,7 @@ Pytest configuration and fixtures for Algorithm Visualizer tests.
 Handles GUI testing compatibility, headless environments, and test setup.
 """
 
+import functools
 import os
 import sys
 import pytest
@@ -11,13 +12,82 @@ import tkinter as tk
 from unittest.mock import patch
 
 
+class _FakeTkRoot:
+    """
+    Do-nothing stand-in for tk.Tk in headless tests.
+    
+    Provides just the root methods the application calls, as plain no-ops,
+    so scheduling hundreds of frames costs no more than the calls themselves.
+    """
+    
+    __slots__ = ()
+    
+    def withdraw(self):
+        pass
+    
+    def destroy(self):
+        pass
+    
+    def after(self, ms, func=None, *args):
+        return "0"
+    
+    def after_cancel(self, after_id):
+        pass
+    
+    def update(self):
+        pass
+    
+    def update_idletasks(self):
+        pass
+    
+    def mainloop(self):
+        pass
+
+
+@functools.lru_cache(maxsize=1)
+def _headless_root():
+    """Return the fake root shared by every headless test; it has no state."""
+    return _FakeTkRoot()
+
+
+class CallRecorder:
+    """
+    Callable that records the arguments of every call made to it.
+    
+    A lighter stand-in for Mock when a test only needs to see what a
+    callback was called with.
+    """
+    
+    __slots__ = ('calls',)
+    
+    def __init__(self):
+        self.calls = []
+    
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+
+
+def pytest_configure(config):
+    """Set up the process environment before any Tk root is created."""
+    # Keep macOS system Tk from printing its deprecation notice on startup
+    if sys.platform == "darwin":
+        os.environ.setdefault("TK_SILENCE_DEPRECATION", "1")
+
+
+@functools.lru_cache(maxsize=1)
 def is_headless_environment():
     """
     Detect if we're running in a headless environment.
     
+    The result is cached, so the Tk probe below runs at most once per process.
+    
     Returns:
         bool: True if headless (no display available)
     """
+    # Explicit opt-in lets CI skip the Tk startup entirely
+    if os.environ.get('PYTEST_HEADLESS'):
+        return True
+    
     # Check common CI environment variables
     ci_indicators = ['CI', 'CONTINUOUS_INTEGRATION', 'GITHUB_ACTIONS', 'TRAVIS', 'JENKINS_URL']
     if any(os.environ.get(var) for var in ci_indicators):
@@ -27,6 +97,11 @@ def is_headless_environment():
     if sys.platform.startswith('linux') and not os.environ.get('DISPLAY'):
         return True
     
+    # Windows sessions without an interactive desktop (services, SSH) have
+    # no SESSIONNAME, and creating a Tk root there can stall
+    if sys.platform == 'win32' and not os.environ.get('SESSIONNAME'):
+        return True
+    
     # Try to create a test Tk instance
     try:
         test_root = tk.Tk()
@@ -43,52 +118,56 @@ def headless_environment():
     return is_headless_environment()
 
 
-@pytest.fixture(autouse=True)
-def gui_environment_check(request, headless_environment):
+@pytest.fixture
+def recorder():
+    """Fixture that provides a fresh CallRecorder."""
+    return CallRecorder()
+
+
+def pytest_collection_modifyitems(config, items):
     """
-    Automatically check if GUI tests can run in current environment.
+    Check once at collection whether GUI tests can run in current environment.
     
     Skips tests marked with @pytest.mark.gui if running in headless environment
-    without proper display setup.
+    without proper display setup. Otherwise puts them in one xdist group, so
+    with `-n auto --dist loadgroup` they share a single worker and its Tk
+    root while the other tests spread across all workers.
     """
-    if request.node.get_closest_marker('gui') and headless_environment:
-        pytest.skip("GUI test skipped in headless environment")
+    if is_headless_environment():
+        gui_marker = pytest.mark.skip(reason="GUI test skipped in headless environment")
+    else:
+        gui_marker = pytest.mark.xdist_group("gui")
+    
+    for item in items:
+        if 'gui' in item.keywords:
+            item.add_marker(gui_marker)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_tkinter_root():
     """
-    Fixture that provides a mocked Tkinter root for headless testing.
-    
-    Returns a mock object that can be used instead of tk.Tk() in tests.
-    """
-    from unittest.mock import MagicMock
+    Fixture that provides a fake Tkinter root for headless testing.
     
-    mock_root = MagicMock()
-    mock_root.withdraw.return_value = None
-    mock_root.destroy.return_value = None
-    mock_root.after.return_value = "mock_after_id"
-    mock_root.after_cancel.return_value = None
-    mock_root.update.return_value = None
-    mock_root.mainloop.return_value = None
+    The fake keeps no state, so one is shared by the whole session.
     
-    return mock_root
+    Returns a stub object that can be used instead of tk.Tk() in tests.
+    """
+    return _headless_root()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def safe_tkinter_root(headless_environment):
     """
-    Fixture that provides a safe Tkinter root, mocked in headless environments.
+    Fixture that provides a safe Tkinter root, stubbed out in headless environments.
+    
+    Building a Tk root is slow, so one is shared by the whole session; use
+    tk_root_clean to get it with pending callbacks cancelled after each test.
     
     Returns:
-        Either a real tk.Tk() instance or a mock, depending on environment
+        Either a real tk.Tk() instance or a fake, depending on environment
     """
     if headless_environment:
-        from unittest.mock import MagicMock
-        mock_root = MagicMock()
-        mock_root.withdraw.return_value = None
-        mock_root.destroy.return_value = None
-        yield mock_root
+        yield _headless_root()
     else:
         root = tk.Tk()
         root.withdraw()  # Hide window
@@ -101,6 +180,57 @@ def safe_tkinter_root(headless_environment):
                 pass  # Already destroyed
 
 
+@pytest.fixture
+def tk_root_clean(safe_tkinter_root):
+    """Provide the shared root, dropping anything a test left scheduled on it."""
+    yield safe_tkinter_root
+    if isinstance(safe_tkinter_root, tk.Tk):
+        try:
+            for after_id in safe_tkinter_root.tk.splitlist(
+                safe_tkinter_root.tk.call('after', 'info')
+            ):
+                safe_tkinter_root.after_cancel(after_id)
+        except tk.TclError:
+            pass  # Destroyed by the test
+
+
+@pytest.fixture(scope="class")
+def panels(safe_tkinter_root):
+    """
+    Fixture that provides one set of UI panels for a whole test class.
+    
+    Building the panels' widgets is slow, so tests that only wire up
+    callbacks share them; callbacks and messages are reset after each test.
+    
+    Returns:
+        Tuple of (ControlPanel, VisualizationCanvas, LegendPanel)
+    """
+    from ui import ControlPanel, VisualizationCanvas, LegendPanel
+    
+    frames = [tk.Frame(safe_tkinter_root) for _ in range(3)]
+    control_frame, canvas_frame, legend_frame = frames
+    yield (
+        ControlPanel(control_frame),
+        VisualizationCanvas(canvas_frame),
+        LegendPanel(legend_frame),
+    )
+    for frame in frames:
+        frame.destroy()
+
+
+@pytest.fixture
+def panels_clean(panels):
+    """Provide the shared panels, restoring their callbacks afterwards."""
+    yield panels
+    control_panel, canvas, legend_panel = panels
+    control_panel.set_algorithm_change_callback(None)
+    control_panel.set_array_change_callback(None)
+    control_panel.set_playback_callbacks(None, None, None)
+    control_panel.set_speed_change_callback(None)
+    canvas.set_array([])
+    legend_panel.clear_messages()
+
+
 class HeadlessTestMixin:
     """
     Mixin class for test classes that need GUI compatibility.
@@ -111,16 +241,11 @@ class HeadlessTestMixin:
     def create_safe_root(self, headless_environment=None):
         """Create a root that works in both GUI and headless environments."""
         if headless_environment is None:
+            # Cached after the first call, so this no longer re-probes Tk
             headless_environment = is_headless_environment()
             
         if headless_environment:
-            from unittest.mock import MagicMock
-            mock_root = MagicMock()
-            mock_root.withdraw.return_value = None
-            mock_root.destroy.return_value = None
-            mock_root.after.return_value = "mock_after_id"
-            mock_root.after_cancel.return_value = None
-            return mock_root
+            return _headless_root()
         else:
             root = tk.Tk()
             root.withdraw()
@@ -130,14 +255,6 @@ class HeadlessTestMixin:
         """Safely clean up a root window."""
         if hasattr(root, 'destroy') and callable(root.destroy):
             try:
-                if not isinstance(root.destroy, MagicMock):
-                    root.destroy()
+                root.destroy()
             except (tk.TclError, AttributeError):
                 pass
-
-
-# Pytest markers for different test categories
-pytestmark = [
-    pytest.mark.filterwarnings("ignore::DeprecationWarning"),
-    pytest.mark.filterwarnings("ignore::PendingDeprecationWarning"),
-]
\ No newline at end of file
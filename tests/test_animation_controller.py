@@ -5,10 +5,11 @@ Tests cover animation state management, timing control, callback functionality,
 and proper cleanup of resources.
 """
 
+import os
 import pytest
 import tkinter as tk
-import time
 from unittest.mock import Mock, MagicMock
+from algorithms.base_algorithm import StepDescription
 from utils.animation_controller import AnimationController
 from utils.constants import (
     ANIMATION_SPEED_DEFAULT,
@@ -16,37 +17,67 @@ from utils.constants import (
     ANIMATION_SPEED_MAX,
     INTERPOLATION_FRAMES
 )
-from .conftest import HeadlessTestMixin
+from .conftest import HeadlessTestMixin, CallRecorder
+
+# Set PYTEST_FAST=1 to skip the tests that drive a real event loop
+_FAST = os.environ.get('PYTEST_FAST') == '1'
+
+# Sample animation steps, shared by every test. Kept as lists because
+# set_steps() treats any other iterable as a one-shot stream; nothing
+# modifies them.
+_TEST_STEPS = [
+    ("compare", (0, 1), "Comparing elements 0 and 1"),
+    ("swap", (0, 1), "Swapping elements 0 and 1"),
+    ("mark_sorted", (0,), "Element 0 is sorted")
+]
+
+_INTEGRATION_STEPS = [
+    ("compare", (0, 1), "Compare 0 and 1"),
+    ("swap", (0, 1), "Swap 0 and 1")
+]
+
+
+def reset_controller(controller):
+    """Return a shared controller to the state of a freshly built one."""
+    controller.reset()
+    controller.set_steps([])
+    controller.set_speed(ANIMATION_SPEED_DEFAULT)
+    controller.set_step_callback(None)
+    controller.set_completion_callback(None)
+    controller.set_error_callback(None)
 
 
 @pytest.mark.gui
 class TestAnimationController(HeadlessTestMixin):
     """Test cases for AnimationController functionality."""
     
-    def setup_method(self):
-        """Setup test environment before each test."""
-        # Create a safe tkinter root for testing
-        self.root = self.create_safe_root()
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def setup_controller(cls, safe_tkinter_root):
+        """Setup one controller shared by every test in the class."""
+        # Share the session's tkinter root instead of building one per test
+        cls.root = safe_tkinter_root
         
         # Create mock callback
-        self.mock_callback = Mock()
+        cls.mock_callback = CallRecorder()
         
         # Create animation controller
-        self.controller = AnimationController(self.root, self.mock_callback)
+        cls.controller = AnimationController(cls.root, cls.mock_callback)
         
         # Sample animation steps for testing
-        self.test_steps = [
-            ("compare", [0, 1], "Comparing elements 0 and 1"),
-            ("swap", [0, 1], "Swapping elements 0 and 1"),
-            ("mark_sorted", [0], "Element 0 is sorted")
-        ]
+        cls.test_steps = _TEST_STEPS
+        
+        yield
+        
+        # The shared root stays alive for the rest of the session
+        cls.controller.cleanup()
     
-    def teardown_method(self):
-        """Cleanup after each test."""
-        if hasattr(self, 'controller'):
-            self.controller.cleanup()
-        if hasattr(self, 'root'):
-            self.cleanup_root(self.root)
+    @pytest.fixture(autouse=True)
+    def reset_between_tests(self, tk_root_clean):
+        """Undo whatever the previous test did to the shared controller."""
+        yield
+        reset_controller(self.controller)
+        self.mock_callback.calls.clear()
     
     def test_initialization(self):
         """Test controller initialization."""
@@ -66,23 +97,16 @@ class TestAnimationController(HeadlessTestMixin):
         assert self.controller.current_step == 0
         assert self.controller.interpolation_frame == 0
     
-    def test_speed_control(self):
+    @pytest.mark.parametrize("speed, expected", [
+        (2.0, 2.0),  # Valid speed
+        (0.1, ANIMATION_SPEED_MIN),  # Minimum bound
+        (10.0, ANIMATION_SPEED_MAX),  # Maximum bound
+        (-1.0, ANIMATION_SPEED_MIN),  # Negative speed
+    ])
+    def test_speed_control(self, speed, expected):
         """Test speed setting and bounds."""
-        # Test valid speed
-        self.controller.set_speed(2.0)
-        assert self.controller.speed == 2.0
-        
-        # Test minimum bound
-        self.controller.set_speed(0.1)
-        assert self.controller.speed == ANIMATION_SPEED_MIN
-        
-        # Test maximum bound
-        self.controller.set_speed(10.0)
-        assert self.controller.speed == ANIMATION_SPEED_MAX
-        
-        # Test negative speed
-        self.controller.set_speed(-1.0)
-        assert self.controller.speed == ANIMATION_SPEED_MIN
+        self.controller.set_speed(speed)
+        assert self.controller.speed == expected
     
     def test_frame_interval_calculation(self):
         """Test frame interval calculation based on speed."""
@@ -156,7 +180,9 @@ class TestAnimationController(HeadlessTestMixin):
         assert not self.controller.is_paused
         
         # Should call update callback with reset
-        self.mock_callback.assert_called_with("reset", [], "Reset to initial state")
+        assert self.mock_callback.calls[-1] == (
+            ("reset", [], "Reset to initial state"), {}
+        )
     
     def test_callback_registration(self):
         """Test callback registration and calling."""
@@ -195,6 +221,23 @@ class TestAnimationController(HeadlessTestMixin):
         self.controller.play()
         assert not self.controller.is_playing
     
+    def test_streamed_steps(self):
+        """Test setting steps from an iterator with an estimated total."""
+        self.controller.set_steps(iter(self.test_steps), estimated_total=10)
+
+        current, total = self.controller.get_progress()
+        assert current == 0
+        assert total == 10
+
+        # Should be able to start animation
+        self.controller.play()
+        assert self.controller.is_playing
+
+        # Stopping discards the stream since it cannot be replayed
+        self.controller.stop()
+        self.controller.play()
+        assert not self.controller.is_playing
+
     def test_single_step_animation(self):
         """Test animation with single step."""
         single_step = [("compare", [0, 1], "Single comparison")]
@@ -203,47 +246,138 @@ class TestAnimationController(HeadlessTestMixin):
         current, total = self.controller.get_progress()
         assert current == 0
         assert total == 1
-        
+
         # Should be able to start animation
         self.controller.play()
         assert self.controller.is_playing
 
+    def test_late_frames_skip_interpolation(self, monkeypatch):
+        """Test frames that run late jump straight to the step's final frame."""
+        clock = [0.0]
+        monkeypatch.setattr("utils.animation_controller.monotonic", lambda: clock[0])
+        self.controller.set_steps([("swap", (0, 1), "Swapping elements 0 and 1")])
+        self.controller.play()
+
+        # Every frame runs a full second after it was due
+        for _ in range(2):
+            clock[0] += 1.0
+            self.controller._execute_frame()
+
+        frames = [args[3]["interpolation_frame"] for args, _ in self.mock_callback.calls]
+        assert frames == [0, INTERPOLATION_FRAMES - 1]
+        assert self.controller.current_step == 1
+
+    def test_fast_speed_draws_fewer_frames(self):
+        """Test high speeds draw each step with fewer, longer frames."""
+        self.controller.set_speed(1.0)
+        step_duration = self.controller.get_frame_interval() * INTERPOLATION_FRAMES
+
+        self.controller.set_speed(ANIMATION_SPEED_MAX)
+        self.controller.set_steps([("swap", (0, 1), "Swapping elements 0 and 1")])
+        self.controller.play()
+        frames = self.controller.get_step_frames()
+        assert 2 <= frames < INTERPOLATION_FRAMES
+        for _ in range(frames):
+            self.controller._execute_frame()
+
+        data = [args[3] for args, _ in self.mock_callback.calls]
+        assert [d["progress"] for d in data] == [i / frames for i in range(frames)]
+        assert [d["is_final_frame"] for d in data] == [False] * (frames - 1) + [True]
+        assert self.controller.current_step == 1
+        # The step still lasts as long as the speed asks for
+        per_step = self.controller._frame_delay() * frames
+        assert per_step == pytest.approx(step_duration / ANIMATION_SPEED_MAX, rel=0.1)
+
+    def test_static_actions_draw_one_frame(self):
+        """Test steps without in-between frames are drawn once and held."""
+        self.controller.set_steps(self.test_steps)
+        self.controller.play()
+        step_duration = self.controller.get_frame_interval() * INTERPOLATION_FRAMES
+
+        # The comparison is a single final frame, then the swap is animated
+        self.controller._execute_frame()
+        assert self.controller._frame_delay() == step_duration
+        for _ in range(self.controller.get_step_frames()):
+            self.controller._execute_frame()
+        self.controller._execute_frame()
+
+        data = [args[3] for args, _ in self.mock_callback.calls]
+        actions = [args[0] for args, _ in self.mock_callback.calls]
+        assert actions == ["compare"] + ["swap"] * INTERPOLATION_FRAMES + ["mark_sorted"]
+        assert data[0]["is_final_frame"] and data[-1]["is_final_frame"]
+        assert self.controller.current_step == 3
+
+    @pytest.mark.parametrize("description", [
+        StepDescription("Array updated: {}", [1, 2, 3]),
+        "Array updated: [1, 2, 3]",
+    ], ids=["lazy", "plain"])
+    def test_array_update_passes_array_state(self, description):
+        """Test an array update hands its snapshot over as animation data."""
+        snapshot = [1, 2, 3]
+        self.controller.set_steps([
+            ("array_update", (0, 1, 2), description, snapshot),
+        ])
+        self.controller.play()
+        self.controller._execute_frame()
+
+        (action, indices, text, animation_data), _ = self.mock_callback.calls[-1]
+        assert action == "array_update"
+        assert indices == (0, 1, 2)
+        assert text == "Array updated: [1, 2, 3]"
+        assert animation_data["array_state"] is snapshot
+
+    def test_steps_without_snapshot_have_no_array_state(self):
+        """Test only steps that carry a snapshot report an array state."""
+        self.controller.set_steps([("array_update", (0, 1), "Array updated")])
+        self.controller.play()
+        self.controller._execute_frame()
+
+        (_, _, _, animation_data), _ = self.mock_callback.calls[-1]
+        assert "array_state" not in animation_data
+
 
 @pytest.mark.gui
+@pytest.mark.skipif(_FAST, reason="Slow integration test skipped with PYTEST_FAST=1")
 class TestAnimationControllerIntegration(HeadlessTestMixin):
     """Integration tests for AnimationController with mock UI updates."""
     
-    def setup_method(self):
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def setup_controller(cls, safe_tkinter_root):
         """Setup test environment."""
-        self.root = self.create_safe_root()
+        cls.root = safe_tkinter_root
         
-        self.update_calls = []
+        cls.update_calls = []
         
         def mock_update(action, indices, description, animation_data=None):
-            self.update_calls.append({
+            cls.update_calls.append({
                 'action': action,
                 'indices': indices,
                 'description': description,
                 'animation_data': animation_data
             })
         
-        self.controller = AnimationController(self.root, mock_update)
+        cls.controller = AnimationController(cls.root, mock_update)
         
         # Simple test steps
-        self.test_steps = [
-            ("compare", [0, 1], "Compare 0 and 1"),
-            ("swap", [0, 1], "Swap 0 and 1")
-        ]
+        cls.test_steps = _INTEGRATION_STEPS
+        
+        yield
+        
+        cls.controller.cleanup()
     
-    def teardown_method(self):
-        """Cleanup."""
-        if hasattr(self, 'controller'):
-            self.controller.cleanup()
-        if hasattr(self, 'root'):
-            self.cleanup_root(self.root)
+    @pytest.fixture(autouse=True)
+    def reset_between_tests(self, tk_root_clean):
+        """Undo whatever the previous test did to the shared controller."""
+        yield
+        reset_controller(self.controller)
+        self.update_calls.clear()
     
-    def test_animation_data_structure(self):
+    def test_animation_data_structure(self, monkeypatch):
         """Test that animation data is properly structured."""
+        # Schedule every frame immediately so the test never waits on the clock
+        monkeypatch.setattr(self.controller, 'get_frame_interval', lambda: 0)
+        
         self.controller.set_steps(self.test_steps)
         
         step_calls = []
@@ -258,16 +392,18 @@ class TestAnimationControllerIntegration(HeadlessTestMixin):
         self.controller.set_step_callback(step_callback)
         self.controller.set_completion_callback(completion_callback)
         
-        # Set very fast speed to minimize test time
-        self.controller.set_speed(ANIMATION_SPEED_MAX)
-        
         # Start animation
         self.controller.play()
         
-        # Let a few frames execute
-        for _ in range(5):
+        # Pump the event loop until the animation finishes; every step takes
+        # INTERPOLATION_FRAMES frames plus one for the completion
+        for _ in range(len(self.test_steps) * INTERPOLATION_FRAMES + 2):
+            if not self.controller.is_playing:
+                break
+            self.root.update_idletasks()
             self.root.update()
-            time.sleep(0.001)  # Very short sleep
+        
+        assert completion_calls == ["completed"]
         
         # Check that update calls were made
         if self.update_calls:
@@ -306,17 +442,22 @@ class TestAnimationControllerIntegration(HeadlessTestMixin):
 class TestAnimationControllerErrorHandling(HeadlessTestMixin):
     """Test error handling and edge cases."""
     
-    def setup_method(self):
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def setup_controller(cls, safe_tkinter_root):
         """Setup test environment."""
-        self.root = self.create_safe_root()
-        self.controller = AnimationController(self.root, Mock())
+        cls.root = safe_tkinter_root
+        cls.controller = AnimationController(cls.root, CallRecorder())
+        
+        yield
+        
+        cls.controller.cleanup()
     
-    def teardown_method(self):
-        """Cleanup."""
-        if hasattr(self, 'controller'):
-            self.controller.cleanup()
-        if hasattr(self, 'root'):
-            self.cleanup_root(self.root)
+    @pytest.fixture(autouse=True)
+    def reset_between_tests(self, tk_root_clean):
+        """Undo whatever the previous test did to the shared controller."""
+        yield
+        reset_controller(self.controller)
     
     def test_malformed_steps(self):
         """Test handling of malformed animation steps."""
@@ -356,16 +497,37 @@ class TestAnimationControllerErrorHandling(HeadlessTestMixin):
         # Should still work without callbacks
         assert self.controller.is_playing
     
-    def test_destroyed_root(self):
+    def test_destroyed_root(self, recorder):
         """Test behavior when root is destroyed during animation."""
-        self.controller.set_steps([("test", [0], "Test")])
-        self.controller.play()
+        # Use a root of its own so the shared one survives
+        root = self.create_safe_root()
+        controller = AnimationController(root, recorder)
+        controller.set_steps([("test", [0], "Test")])
+        controller.play()
         
         # Destroy root
-        self.root.destroy()
+        root.destroy()
         
         # Cleanup should not crash
-        self.controller.cleanup()
+        controller.cleanup()
+
+    def test_streamed_step_error_reported(self):
+        """Test that an error while generating a streamed step is reported."""
+        def failing_steps():
+            yield ("compare", (0, 1), "Compare 0 and 1")
+            raise ValueError("bad step")
+
+        errors = []
+        self.controller.set_error_callback(errors.append)
+        self.controller.set_steps(failing_steps(), estimated_total=2)
+        self.controller.play()
+
+        # Run the frames directly instead of waiting for after()
+        while self.controller.is_playing:
+            self.controller._execute_frame()
+
+        assert [str(error) for error in errors] == ["bad step"]
+        assert self.controller.step_iterator is None
 
 
 if __name__ == "__main__":
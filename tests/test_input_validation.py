@@ -0,0 +1,58 @@
+"""
+Integration tests for input validation as used by the UI.
+
+These need no Tk, so they live apart from the GUI integration tests
+and still run when those are deselected with -m "not gui".
+"""
+
+from utils import InputValidator
+
+
+class TestInputValidationIntegration:
+    """Test integration with input validation (no GUI needed)."""
+
+    def test_input_validator_integration(self):
+        """Test that InputValidator integrates properly with UI."""
+        # Test valid input
+        valid_input = "1,2,3,4,5"
+        is_valid, numbers, error = InputValidator.validate_input(valid_input)
+
+        assert is_valid is True
+        assert numbers == [1, 2, 3, 4, 5]
+        assert error is None
+
+        # Test invalid input
+        invalid_input = "1,abc,3"
+        is_valid, numbers, error = InputValidator.validate_input(invalid_input)
+
+        assert is_valid is False
+        assert numbers is None
+        assert error is not None
+        assert isinstance(error, str)
+        assert len(error) > 0
+
+    def test_array_size_validation(self):
+        """Test array size validation."""
+        # Test valid size
+        assert InputValidator.validate_array_size(10) is True
+        assert InputValidator.validate_array_size(50) is True
+
+        # Test invalid sizes
+        assert InputValidator.validate_array_size(0) is False
+        assert InputValidator.validate_array_size(-1) is False
+        assert InputValidator.validate_array_size(1000) is False
+
+    def test_validation_messages(self):
+        """Test validation message generation."""
+        test_numbers = [5, 2, 8, 1, 9]
+        message = InputValidator.get_validation_message(test_numbers)
+
+        assert isinstance(message, str)
+        assert len(message) > 0
+        assert "5 elements" in message or "5" in message
+
+        # Test formatting
+        formatted = InputValidator.format_input(test_numbers)
+        assert isinstance(formatted, str)
+        assert "5" in formatted
+        assert "2" in formatted
@@ -5,157 +5,148 @@ Tests cover security aspects including input sanitization,
 malicious input handling, and edge case validation.
 """
 
+import re
 import pytest
 from utils.input_validator import InputValidator
 
 
-class TestInputValidator:
-    """Test cases for InputValidator security and robustness."""
-    
-    def test_valid_input(self):
-        """Test valid comma-separated integers."""
-        valid, numbers, error = InputValidator.validate_input("1,2,3,4,5")
-        assert valid is True
-        assert numbers == [1, 2, 3, 4, 5]
-        assert error is None
-    
-    def test_empty_input(self):
-        """Test empty input handling."""
-        valid, numbers, error = InputValidator.validate_input("")
-        assert valid is False
-        assert numbers is None
-        assert error is not None
-    
-    def test_whitespace_handling(self):
-        """Test whitespace sanitization."""
-        valid, numbers, error = InputValidator.validate_input("  1 , 2 , 3  ")
-        assert valid is True
-        assert numbers == [1, 2, 3]
-    
-    def test_trailing_comma(self):
-        """Test trailing comma handling."""
-        valid, numbers, error = InputValidator.validate_input("1,2,3,")
-        assert valid is True
-        assert numbers == [1, 2, 3]
-    
-    def test_double_commas(self):
-        """Test double comma handling."""
-        valid, numbers, error = InputValidator.validate_input("1,,2,3")
-        assert valid is True
-        assert numbers == [1, 2, 3]
-    
-    def test_negative_numbers(self):
-        """Test negative number rejection (outside valid range 1-100)."""
-        valid, numbers, error = InputValidator.validate_input("-5,-1,0,1,5")
-        assert valid is False  # Negative numbers and zero are outside valid range
-        assert numbers is None
-        assert error is not None
-    
-    # Security Tests
-    def test_sql_injection_attempt(self):
-        """Test SQL injection-like input."""
-        malicious_input = "1; DROP TABLE users; --"
-        valid, numbers, error = InputValidator.validate_input(malicious_input)
-        assert valid is False
-        assert numbers is None
-        assert error is not None
-    
-    def test_script_injection_attempt(self):
-        """Test script injection-like input."""
-        malicious_input = "<script>alert('xss')</script>"
-        valid, numbers, error = InputValidator.validate_input(malicious_input)
-        assert valid is False
-        assert numbers is None
-        assert error is not None
-    
-    def test_buffer_overflow_attempt(self):
-        """Test extremely long input."""
-        long_input = "1," * 1000  # Attempt to create very long input
-        valid, numbers, error = InputValidator.validate_input(long_input)
-        assert valid is False  # Should fail due to size limits
-        assert numbers is None
-        assert error is not None
-    
-    def test_invalid_characters(self):
-        """Test input with invalid characters."""
-        invalid_inputs = [
-            "1,2,abc,4",
-            "1.5,2.5,3.5",
-            "1,2,3e4,5",
-            "1,2,0xFF,4",
-            "1,2,∞,4"
-        ]
-        
-        for invalid_input in invalid_inputs:
-            valid, numbers, error = InputValidator.validate_input(invalid_input)
-            assert valid is False, f"Should reject: {invalid_input}"
-            assert numbers is None
-            assert error is not None
-    
-    def test_range_validation(self):
-        """Test number range validation."""
-        # Test values outside expected range
-        valid, numbers, error = InputValidator.validate_input("999999")
-        assert valid is False  # Assuming max value < 999999
-        assert numbers is None
-        assert error is not None
-    
-    def test_format_input(self):
-        """Test input formatting function."""
-        numbers = [1, 2, 3, 4, 5]
-        formatted = InputValidator.format_input(numbers)
-        assert formatted == "1, 2, 3, 4, 5"
-    
-    def test_array_size_validation(self):
-        """Test array size limits."""
-        # Test maximum size
-        assert InputValidator.validate_array_size(50) is True
-        assert InputValidator.validate_array_size(1000) is False
-        assert InputValidator.validate_array_size(0) is False
-    
-    def test_validation_message(self):
-        """Test validation message generation."""
-        numbers = [1, 3, 5, 2, 4]
-        message = InputValidator.get_validation_message(numbers)
-        assert "5 elements" in message
-        assert "1-5" in message or "range: 1-5" in message
-    
-    def test_regex_validation(self):
-        """Test internal regex validation."""
-        assert InputValidator._is_valid_integer("123") is True
-        assert InputValidator._is_valid_integer("-123") is True
-        assert InputValidator._is_valid_integer("abc") is False
-        assert InputValidator._is_valid_integer("12.3") is False
-        assert InputValidator._is_valid_integer("") is False
-    
-    # Edge Cases
-    def test_single_element(self):
-        """Test single element input."""
-        valid, numbers, error = InputValidator.validate_input("42")
-        assert valid is True
-        assert numbers == [42]
-        assert error is None
-    
-    def test_zero_value(self):
-        """Test zero value rejection (outside valid range 1-100)."""
-        valid, numbers, error = InputValidator.validate_input("0")
-        assert valid is False  # Zero is outside valid range (1-100)
-        assert numbers is None
-        assert error is not None
-    
-    def test_valid_range_numbers(self):
-        """Test valid numbers within range 1-100."""
-        valid, numbers, error = InputValidator.validate_input("1,50,100")
-        assert valid is True
-        assert numbers == [1, 50, 100]
-        assert error is None
-    
-    def test_duplicate_values(self):
-        """Test duplicate values (should be allowed)."""
-        valid, numbers, error = InputValidator.validate_input("1,1,2,2,3")
-        assert valid is True
-        assert numbers == [1, 1, 2, 2, 3]
-        assert error is None
+@pytest.mark.parametrize("raw, expected_valid, expected_numbers", [
+    ("1,2,3,4,5", True, [1, 2, 3, 4, 5]),
+    ("", False, None),
+    ("  1 , 2 , 3  ", True, [1, 2, 3]),
+    ("1,2,3,", True, [1, 2, 3]),
+    ("1,,2,3", True, [1, 2, 3]),
+    ("-5,-1,0,1,5", False, None),  # Outside valid range 1-100
+    ("42", True, [42]),
+    ("0", False, None),  # Outside valid range 1-100
+    ("1,50,100", True, [1, 50, 100]),
+    ("1,1,2,2,3", True, [1, 1, 2, 2, 3]),  # Duplicates are allowed
+], ids=[
+    "valid",
+    "empty",
+    "whitespace",
+    "trailing_comma",
+    "double_commas",
+    "negative_numbers",
+    "single_element",
+    "zero_value",
+    "valid_range_numbers",
+    "duplicate_values",
+])
+def test_validate_input(raw, expected_valid, expected_numbers):
+    """Test parsing and validation of well-formed and out-of-range input."""
+    valid, numbers, error = InputValidator.validate_input(raw)
+    assert valid is expected_valid
+    assert numbers == expected_numbers
+    assert (error is None) is expected_valid
+
+
+# Security Tests
+def test_sql_injection_attempt():
+    """Test SQL injection-like input."""
+    malicious_input = "1; DROP TABLE users; --"
+    valid, numbers, error = InputValidator.validate_input(malicious_input)
+    assert valid is False
+    assert numbers is None
+    assert error is not None
+
+
+def test_script_injection_attempt():
+    """Test script injection-like input."""
+    malicious_input = "<script>alert('xss')</script>"
+    valid, numbers, error = InputValidator.validate_input(malicious_input)
+    assert valid is False
+    assert numbers is None
+    assert error is not None
+
+
+def test_buffer_overflow_attempt():
+    """Test extremely long input."""
+    long_input = "1," * 1000  # Attempt to create very long input
+    valid, numbers, error = InputValidator.validate_input(long_input)
+    assert valid is False  # Should fail due to size limits
+    assert numbers is None
+    assert error is not None
+
+
+@pytest.mark.parametrize("invalid_input", [
+    "1,2,abc,4",
+    "1.5,2.5,3.5",
+    "1,2,3e4,5",
+    "1,2,0xFF,4",
+    "1,2,∞,4"
+])
+def test_invalid_characters(invalid_input):
+    """Test input with invalid characters."""
+    valid, numbers, error = InputValidator.validate_input(invalid_input)
+    assert valid is False, f"Should reject: {invalid_input}"
+    assert numbers is None
+    assert error is not None
+
+
+@pytest.mark.parametrize("out_of_range_input", [
+    "999999",
+    "101",
+    "0",
+    "1,2,101"
+])
+def test_range_validation(out_of_range_input):
+    """Test number range validation."""
+    # Test values outside expected range
+    valid, numbers, error = InputValidator.validate_input(out_of_range_input)
+    assert valid is False
+    assert numbers is None
+    assert error is not None
+
+
+def test_format_input():
+    """Test input formatting function."""
+    numbers = [1, 2, 3, 4, 5]
+    formatted = InputValidator.format_input(numbers)
+    assert formatted == "1, 2, 3, 4, 5"
+
+
+def test_array_size_validation():
+    """Test array size limits."""
+    # Test maximum size
+    assert InputValidator.validate_array_size(50) is True
+    assert InputValidator.validate_array_size(1000) is False
+    assert InputValidator.validate_array_size(0) is False
+
+
+def test_validation_message():
+    """Test validation message generation."""
+    numbers = [1, 3, 5, 2, 4]
+    message = InputValidator.get_validation_message(numbers)
+    assert "5 elements" in message
+    assert "1-5" in message or "range: 1-5" in message
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("123", True),
+    ("-123", True),
+    ("abc", False),
+    ("12.3", False),
+    ("", False)
+])
+def test_regex_validation(text, expected):
+    """Test internal regex validation."""
+    assert InputValidator._is_valid_integer(text) is expected
+
+
+def test_integer_pattern_compiled_once():
+    """Test the integer pattern is compiled at import, not per call."""
+    assert isinstance(InputValidator._INT_RE, re.Pattern)
+    assert InputValidator._INT_RE.pattern == r"^-?\d+$"
+
+
+def test_repeated_input_returns_fresh_list():
+    """Test cached results cannot be changed through a returned list."""
+    _, first, _ = InputValidator.validate_input("3, 1, 2")
+    first.append(99)
+    _, second, _ = InputValidator.validate_input("3, 1, 2")
+    assert second == [3, 1, 2]
+    assert second is not first
 
 
 if __name__ == "__main__":
@@ -5,9 +5,94 @@ Tests cover correctness, edge cases, and animation step generation
 for all implemented sorting algorithms.
 """
 
+import functools
+import re
+from itertools import chain
+from math import log2
 import pytest
 from algorithms import ALGORITHMS
-from algorithms.base_algorithm import SortingAlgorithm
+from algorithms.base_algorithm import SortingAlgorithm, StepDescription
+
+
+# Snapshot of the registered algorithm names, iterated by many tests
+_ALGO_NAMES = tuple(ALGORITHMS)
+
+# Canonical test inputs, with their sorted forms computed once
+_REVERSE = (5, 4, 3, 2, 1)
+_REVERSE_SORTED = sorted(_REVERSE)
+_RANDOM = (3, 1, 4, 1, 5, 9, 2, 6, 5, 3)
+_RANDOM_SORTED = sorted(_RANDOM)
+_DUPLICATES = (3, 1, 3, 1, 3, 1)
+_DUPLICATES_SORTED = sorted(_DUPLICATES)
+
+# A complete Big O term such as O(1), O(n²) or O(n log n)
+_BIG_O = re.compile(r"O\([^()]+\)")
+
+# Every action an algorithm step may use
+_EXPECTED_ACTIONS = frozenset({
+    "compare", "compare_range", "swap", "mark_sorted", "highlight_pivot",
+    "highlight_current", "highlight_min", "shift", "insert",
+    "array_update", "divide", "merge_start", "place", "run_detected"
+})
+
+
+def _check_steps(steps, array_size):
+    """Assert the structure, actions and indices of a list of steps."""
+    for step in steps:
+        # (action, indices, description), plus the snapshot for array updates
+        action, indices, description, *snapshot = step
+        assert len(snapshot) == (action == "array_update")
+        if snapshot:
+            assert isinstance(snapshot[0], list)
+            assert len(snapshot[0]) == array_size
+        assert isinstance(action, str)
+        assert isinstance(indices, tuple)
+        assert isinstance(description, (str, StepDescription))
+        # Should be an action the visualization knows how to draw, with no
+        # stray whitespace
+        assert action in _EXPECTED_ACTIONS, f"Unexpected action {action!r}"
+    
+    # Indices should be valid; steps reuse the same few, so check each once
+    used_indices = set(chain.from_iterable(step[1] for step in steps))
+    for idx in used_indices:
+        assert isinstance(idx, int)
+        assert 0 <= idx < array_size, f"Invalid index {idx} for array size {array_size}"
+
+
+def _replay(steps, values):
+    """Apply the steps that change the array to a copy of values."""
+    array = list(values)
+    for action, indices, _, *snapshot in steps:
+        if action == "swap":
+            i, j = indices
+            array[i], array[j] = array[j], array[i]
+        elif action == "array_update":
+            array = list(snapshot[0])
+    return array
+
+
+@pytest.fixture(scope="module")
+def algorithms():
+    """Fixture that provides one instance of every algorithm, keyed by name."""
+    return {name: ALGORITHMS[name]() for name in _ALGO_NAMES}
+
+
+@pytest.fixture(scope="module")
+def algo_steps(algorithms):
+    """
+    Fixture that memoizes each algorithm's steps per input array.
+    
+    Steps depend only on the input array, so tests sharing an input reuse
+    one generated step list. Tests must not modify the returned list.
+    
+    Returns a function (algorithm_name, values) -> (algorithm, steps).
+    """
+    @functools.lru_cache(maxsize=None)
+    def get(algorithm_name, values):
+        algorithm = algorithms[algorithm_name]
+        return algorithm, algorithm.get_steps(list(values))
+    
+    return get
 
 
 class TestSortingAlgorithms:
@@ -24,10 +109,7 @@ class TestSortingAlgorithms:
             assert algorithm_name in ALGORITHMS
             assert issubclass(ALGORITHMS[algorithm_name], SortingAlgorithm)
     
-    @pytest.mark.parametrize("algorithm_name", [
-        "Bubble Sort", "Selection Sort", "Insertion Sort", 
-        "Merge Sort", "Quick Sort"
-    ])
+    @pytest.mark.parametrize("algorithm_name", _ALGO_NAMES)
     def test_algorithm_instantiation(self, algorithm_name):
         """Test that all algorithms can be instantiated."""
         algorithm_class = ALGORITHMS[algorithm_name]
@@ -35,202 +117,151 @@ class TestSortingAlgorithms:
         assert isinstance(algorithm_instance, SortingAlgorithm)
         assert algorithm_instance.get_name() == algorithm_name
     
-    @pytest.mark.parametrize("algorithm_name", [
-        "Bubble Sort", "Selection Sort", "Insertion Sort", 
-        "Merge Sort", "Quick Sort"
-    ])
-    def test_empty_array(self, algorithm_name):
-        """Test sorting empty arrays."""
-        algorithm = ALGORITHMS[algorithm_name]()
-        steps = algorithm.get_steps([])
-        assert isinstance(steps, list)
-        # Empty array should have no steps or minimal steps
-        assert len(steps) <= 1
-    
-    @pytest.mark.parametrize("algorithm_name", [
-        "Bubble Sort", "Selection Sort", "Insertion Sort", 
-        "Merge Sort", "Quick Sort"
-    ])
-    def test_single_element(self, algorithm_name):
-        """Test sorting single element arrays."""
-        algorithm = ALGORITHMS[algorithm_name]()
-        test_array = [42]
-        steps = algorithm.get_steps(test_array)
-        
-        assert isinstance(steps, list)
-        # Single element should be trivially sorted
-        # Verify the algorithm doesn't break with single element
-        for step in steps:
-            assert len(step) == 3  # (action, indices, description)
-            assert isinstance(step[0], str)  # action
-            assert isinstance(step[1], list)  # indices
-            assert isinstance(step[2], str)  # description
-    
-    @pytest.mark.parametrize("algorithm_name", [
-        "Bubble Sort", "Selection Sort", "Insertion Sort", 
-        "Merge Sort", "Quick Sort"
-    ])
-    def test_already_sorted_array(self, algorithm_name):
-        """Test sorting already sorted arrays."""
-        algorithm = ALGORITHMS[algorithm_name]()
-        test_array = [1, 2, 3, 4, 5]
-        steps = algorithm.get_steps(test_array)
-        
-        assert isinstance(steps, list)
-        # Algorithm should still generate meaningful steps
-        for step in steps:
-            assert len(step) == 3
-            assert isinstance(step[0], str)
-            assert isinstance(step[1], list)
-            assert isinstance(step[2], str)
-    
-    @pytest.mark.parametrize("algorithm_name", [
-        "Bubble Sort", "Selection Sort", "Insertion Sort", 
-        "Merge Sort", "Quick Sort"
-    ])
-    def test_reverse_sorted_array(self, algorithm_name):
-        """Test sorting reverse-sorted arrays (worst case)."""
-        algorithm = ALGORITHMS[algorithm_name]()
-        test_array = [5, 4, 3, 2, 1]
-        steps = algorithm.get_steps(test_array)
+    @pytest.mark.parametrize("algorithm_name", _ALGO_NAMES)
+    @pytest.mark.parametrize("test_array, min_steps, max_steps, expected_sorted", [
+        ((), 0, 1, None),  # Empty array should have no steps or minimal steps
+        ((42,), 0, None, None),  # Single element is trivially sorted
+        ((1, 2, 3, 4, 5), 0, None, None),
+        (_REVERSE, 1, None, _REVERSE_SORTED),  # Worst case needs multiple steps
+        (_RANDOM, 1, None, _RANDOM_SORTED),
+        (_DUPLICATES, 0, None, _DUPLICATES_SORTED),
+    ], ids=["empty", "single", "sorted", "reverse", "random", "duplicates"])
+    def test_algorithm_invariants(
+        self, algorithm_name, test_array, min_steps, max_steps, expected_sorted, algo_steps
+    ):
+        """Test step structure and correctness across typical input arrays."""
+        algorithm, steps = algo_steps(algorithm_name, test_array)
         
         assert isinstance(steps, list)
-        assert len(steps) > 0  # Should require multiple steps
+        assert len(steps) >= min_steps
+        if max_steps is not None:
+            assert len(steps) <= max_steps
         
-        # Verify step structure
-        for step in steps:
-            assert len(step) == 3
-            assert isinstance(step[0], str)
-            assert isinstance(step[1], list)
-            assert isinstance(step[2], str)
-            # Indices should be valid
-            for idx in step[1]:
-                assert 0 <= idx < len(test_array)
-    
-    @pytest.mark.parametrize("algorithm_name", [
-        "Bubble Sort", "Selection Sort", "Insertion Sort", 
-        "Merge Sort", "Quick Sort"
-    ])
-    def test_random_array(self, algorithm_name):
-        """Test sorting random arrays."""
-        algorithm = ALGORITHMS[algorithm_name]()
-        test_array = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3]
-        steps = algorithm.get_steps(test_array)
-        
-        assert isinstance(steps, list)
-        assert len(steps) > 0
+        _check_steps(steps, len(test_array))
         
         # Test actual sorting correctness using built-in sort_array method
-        sorted_result = algorithm.sort_array(test_array)
-        expected_result = sorted(test_array)
-        assert sorted_result == expected_result
-    
-    @pytest.mark.parametrize("algorithm_name", [
-        "Bubble Sort", "Selection Sort", "Insertion Sort", 
-        "Merge Sort", "Quick Sort"
-    ])
-    def test_duplicate_elements(self, algorithm_name):
-        """Test sorting arrays with duplicate elements."""
-        algorithm = ALGORITHMS[algorithm_name]()
-        test_array = [3, 1, 3, 1, 3, 1]
-        steps = algorithm.get_steps(test_array)
-        
-        assert isinstance(steps, list)
-        
-        # Test correctness
-        sorted_result = algorithm.sort_array(test_array)
-        expected_result = sorted(test_array)
-        assert sorted_result == expected_result
+        if expected_sorted is not None:
+            assert algorithm.sort_array(list(test_array)) == expected_sorted
     
-    @pytest.mark.parametrize("algorithm_name", [
-        "Bubble Sort", "Selection Sort", "Insertion Sort", 
-        "Merge Sort", "Quick Sort"
+    @pytest.mark.parametrize("algorithm_name", _ALGO_NAMES)
+    @pytest.mark.parametrize("test_array", [
+        (),
+        (7,),
+        _DUPLICATES,
+        (2, 2, 2, 2, 2, 2, 2, 2),
+        tuple(range(1, 21)),
+        tuple(range(20, 0, -1)),
+        _RANDOM,
+        (9, 8, 7, 1, 2, 3, 6, 5, 4, 4, 10, 1),
+        tuple((i * 37) % 50 + 1 for i in range(50)),
+        tuple((i * 7) % 5 for i in range(60)),
+    ], ids=[
+        "empty", "single", "duplicates", "all_equal", "presorted",
+        "reversed", "random", "mixed_runs", "ui_size", "few_distinct",
     ])
-    def test_complexity_info(self, algorithm_name):
+    def test_replayed_steps_sort_array(self, algorithm_name, test_array, algorithms):
+        """Test that applying the animation's swaps and updates sorts the input."""
+        algorithm = algorithms[algorithm_name]
+        steps = algorithm.iter_steps(list(test_array))
+        assert _replay(steps, test_array) == sorted(test_array)
+
+    @pytest.mark.parametrize("algorithm_name", _ALGO_NAMES)
+    def test_complexity_info(self, algorithm_name, algorithms):
         """Test that algorithms provide complexity information."""
-        algorithm = ALGORITHMS[algorithm_name]()
+        algorithm = algorithms[algorithm_name]
         time_complexity, space_complexity = algorithm.get_complexity()
         
         assert isinstance(time_complexity, str)
         assert isinstance(space_complexity, str)
         assert len(time_complexity) > 0
         assert len(space_complexity) > 0
-        # Should contain Big O notation
-        assert "O(" in time_complexity
-        assert "O(" in space_complexity
+        # Should contain well-formed Big O notation
+        assert _BIG_O.search(time_complexity), time_complexity
+        assert _BIG_O.search(space_complexity), space_complexity
     
-    @pytest.mark.parametrize("algorithm_name", [
-        "Bubble Sort", "Selection Sort", "Insertion Sort", 
-        "Merge Sort", "Quick Sort"
-    ])
-    def test_description(self, algorithm_name):
+    @pytest.mark.parametrize("algorithm_name", _ALGO_NAMES)
+    def test_description(self, algorithm_name, algorithms):
         """Test that algorithms provide descriptions."""
-        algorithm = ALGORITHMS[algorithm_name]()
+        algorithm = algorithms[algorithm_name]
         description = algorithm.get_description()
         
         assert isinstance(description, str)
         assert len(description) > 10  # Should be meaningful
     
-    def test_step_action_types(self):
-        """Test that algorithms use expected action types in steps."""
-        expected_actions = {
-            "compare", "swap", "mark_sorted", "highlight_pivot", 
-            "highlight_current", "highlight_min", "shift", "insert",
-            "array_update", "divide", "merge_start", "place"
-        }
-        
-        for algorithm_name in ALGORITHMS:
-            algorithm = ALGORITHMS[algorithm_name]()
-            test_array = [3, 1, 4, 1, 5]
-            steps = algorithm.get_steps(test_array)
-            
-            for step in steps:
-                action = step[0]
-                # Action should be a meaningful string
-                assert isinstance(action, str)
-                assert len(action) > 0
-                # While we can't enforce exact action names, they should be reasonable
-                assert not action.startswith(" ")  # No leading whitespace
-                assert not action.endswith(" ")   # No trailing whitespace
-    
-    def test_step_indices_validity(self):
-        """Test that step indices are always valid for the array size."""
-        test_array = [3, 1, 4, 1, 5, 9, 2]
-        array_size = len(test_array)
-        
-        for algorithm_name in ALGORITHMS:
-            algorithm = ALGORITHMS[algorithm_name]()
-            steps = algorithm.get_steps(test_array)
-            
-            for step in steps:
-                indices = step[1]
-                assert isinstance(indices, list)
-                
-                for idx in indices:
-                    assert isinstance(idx, int)
-                    assert 0 <= idx < array_size, f"Invalid index {idx} for array size {array_size}"
-    
-    def test_large_array_performance(self):
+    @pytest.mark.parametrize("algorithm_name", _ALGO_NAMES)
+    def test_iter_steps_matches_get_steps(self, algorithm_name, algo_steps):
+        """Test that streamed steps match the materialized step list."""
+        test_array = list(_RANDOM)
+        algorithm, steps = algo_steps(algorithm_name, _RANDOM)
+
+        streamed = [
+            (action, list(indices), str(description))
+            for action, indices, description, *_ in algorithm.iter_steps(test_array)
+        ]
+        listed = [
+            (action, list(indices), str(description))
+            for action, indices, description, *_ in steps
+        ]
+        assert streamed == listed
+
+    @pytest.mark.parametrize("algorithm_name", _ALGO_NAMES)
+    def test_copy_flag(self, algorithm_name, algorithms):
+        """Test that the input is only sorted in place when copy=False."""
+        algorithm = algorithms[algorithm_name]
+
+        test_array = [3, 1, 4, 1, 5, 9, 2, 6]
+        default_steps = algorithm.get_steps(test_array)
+        assert test_array == [3, 1, 4, 1, 5, 9, 2, 6]
+
+        in_place_steps = algorithm.get_steps(test_array, copy=False)
+        assert test_array == [1, 1, 2, 3, 4, 5, 6, 9]
+        assert len(in_place_steps) == len(default_steps)
+
+    @pytest.mark.parametrize("algorithm_name", _ALGO_NAMES)
+    def test_estimate_step_count(self, algorithm_name, algorithms):
+        """Test that step count estimates are in the right range."""
+        algorithm = algorithms[algorithm_name]
+        assert algorithm.estimate_step_count(0) == 0
+
+        test_array = list(range(20, 0, -1))
+        estimate = algorithm.estimate_step_count(len(test_array))
+        assert estimate > 0
+        assert len(algorithm.get_steps(test_array)) <= 2 * estimate
+
+    # Quadratic sorts stay at UI sizes; n log n sorts are stressed harder
+    @pytest.mark.parametrize("algorithm_name, n", [
+        ("Bubble Sort", 50),
+        ("Selection Sort", 50),
+        ("Insertion Sort", 50),
+        ("Merge Sort", 2000),
+        ("Quick Sort", 2000),
+    ])
+    def test_large_array_performance(self, algorithm_name, n, algo_steps):
         """Test algorithms with larger arrays (basic performance check)."""
-        # Test with moderately large array
-        test_array = list(range(50, 0, -1))  # 50 elements in reverse order
+        # Reverse order is the worst case for the simple sorts
+        test_array = tuple(range(n, 0, -1))
         
-        for algorithm_name in ALGORITHMS:
-            algorithm = ALGORITHMS[algorithm_name]()
-            
-            # This should complete without hanging or crashing
-            steps = algorithm.get_steps(test_array)
-            assert isinstance(steps, list)
-            
-            # Verify correctness
-            sorted_result = algorithm.sort_array(test_array)
-            expected_result = sorted(test_array)
-            assert sorted_result == expected_result
+        # This should complete without hanging or crashing
+        algorithm, steps = algo_steps(algorithm_name, test_array)
+        assert isinstance(steps, list)
+        _check_steps(steps, n)
+        
+        # Verify correctness
+        sorted_result = algorithm.sort_array(list(test_array))
+        assert sorted_result == list(range(1, n + 1))
 
 
 class TestAlgorithmSpecificBehavior:
     """Test specific behaviors for individual algorithms."""
-    
+
+    def test_step_description_formatting(self):
+        """Test that lazy step descriptions render the expected text."""
+        bubble_sort = ALGORITHMS["Bubble Sort"]()
+        steps = bubble_sort.get_steps([2, 1])
+
+        assert str(steps[0][2]) == "Comparing 2 and 1"
+        assert str(steps[1][2]) == "Swapping 2 and 1"
+
     def test_bubble_sort_optimization(self):
         """Test that bubble sort stops early when array becomes sorted."""
         bubble_sort = ALGORITHMS["Bubble Sort"]()
@@ -246,30 +277,87 @@ class TestAlgorithmSpecificBehavior:
         sorted_actions = [step for step in steps if step[0] == "mark_sorted"]
         assert len(sorted_actions) > 0
     
-    def test_merge_sort_divide_conquer(self):
-        """Test that merge sort shows divide and conquer steps."""
+    def test_insertion_sort_marks_each_position_once(self):
+        """Test that insertion sort only marks the advancing sorted frontier."""
+        insertion_sort = ALGORITHMS["Insertion Sort"]()
+        test_array = [5, 4, 3, 2, 1]
+        steps = insertion_sort.get_steps(test_array)
+
+        marked = [tuple(step[1]) for step in steps if step[0] == "mark_sorted"]
+        assert marked == [(i,) for i in range(len(test_array))]
+
+    def test_merge_sort_merges_runs(self):
+        """Test that merge sort merges neighbouring runs until one is left."""
         merge_sort = ALGORITHMS["Merge Sort"]()
         test_array = [4, 2, 7, 1, 9, 3]
         steps = merge_sort.get_steps(test_array)
-        
-        # Should contain divide and merge operations
-        divide_steps = [step for step in steps if "divide" in step[0].lower()]
-        merge_steps = [step for step in steps if "merge" in step[0].lower()]
-        
-        # For non-trivial array, should have divide/merge operations
-        assert len(steps) > 0
+
+        # Three descending pairs become three runs, merged left to right
+        runs = [step[1] for step in steps if step[0] == "run_detected"]
+        assert runs == [(0, 1), (2, 3), (4, 5)]
+        merges = [step[1] for step in steps if step[0] == "merge_start"]
+        assert merges == [(0, 1, 3), (0, 3, 5)]
+
+        # Every merge ends by reporting the merged array
+        updates = [step[3] for step in steps if step[0] == "array_update"]
+        assert updates == [[1, 2, 4, 7, 3, 9], [1, 2, 3, 4, 7, 9]]
     
+    def test_merge_sort_detects_runs(self):
+        """Test that merge sort reuses runs that are already in order."""
+        merge_sort = ALGORITHMS["Merge Sort"]()
+
+        # A sorted array is a single run and needs no merging
+        steps = merge_sort.get_steps(list(range(10)))
+        assert [step[0] for step in steps] == ["run_detected"]
+
+        # A descending run is reversed in place, then merged with the next run
+        steps = merge_sort.get_steps([5, 4, 3, 2, 1, 6, 7])
+        actions = [step[0] for step in steps]
+        assert actions.count("swap") == 2
+        assert actions.count("run_detected") == 2
+        assert actions.count("merge_start") == 1
+
     def test_quick_sort_pivot_selection(self):
         """Test that quick sort shows pivot selection and partitioning."""
         quick_sort = ALGORITHMS["Quick Sort"]()
         test_array = [3, 6, 8, 10, 1, 2, 1]
         steps = quick_sort.get_steps(test_array)
+        actions = [step[0] for step in steps]
+
+        # The median of 3, 10 and 1 is chosen and compared against the rest
+        pivot = actions.index("highlight_pivot")
+        assert steps[pivot][1] == (0,)
+        assert str(steps[pivot][2]) == "Choosing 3 as pivot (median of three)"
+        assert steps[actions.index("compare_range")][1] == (0, 5, 6)
+
+        # The pivot lands between the two partitions and is marked sorted;
+        # both are small enough for insertion sort, so no pivot follows
+        assert ("mark_sorted", (3,)) in [step[:2] for step in steps]
+        assert actions.count("highlight_pivot") == 1
+    
+    @pytest.mark.parametrize("test_array", [
+        list(range(2000)),
+        list(range(2000, 0, -1)),
+        [7] * 2000,
+        [(i * 7) % 5 for i in range(2000)],
+        list(range(1000)) + list(range(1000, 0, -1)),
+    ], ids=["sorted", "reverse", "all_equal", "few_distinct", "organ_pipe"])
+    def test_quick_sort_adversarial_input_not_quadratic(self, test_array):
+        """Test that presorted, duplicate-heavy or organ-pipe input stays O(n log n)."""
+        quick_sort = ALGORITHMS["Quick Sort"]()
+        steps = quick_sort.get_steps(test_array)
         
-        # Should contain pivot-related operations
-        pivot_steps = [step for step in steps if "pivot" in step[0].lower()]
+        # Each compare_range step compares its whole span against the pivot
+        comparisons = sum(
+            step[1][1] - step[1][0] + 1 for step in steps if step[0] == "compare_range"
+        )
         
-        # For non-trivial array, should have pivot operations
-        assert len(steps) > 0
+        # A first/last element pivot, or a partition sending every key equal
+        # to the pivot to one side, makes about n²/2 comparisons on some of
+        # these; the pivot sampling and three-way partition keep each within
+        # a small factor of n log n
+        n = len(test_array)
+        assert comparisons <= 4 * n * log2(n)
 
 
 if __name__ == "__main__":
@@ -10,7 +10,7 @@ import tkinter as tk
 from unittest.mock import Mock, MagicMock, patch
 from ui import ControlPanel, VisualizationCanvas, LegendPanel
 from algorithms import ALGORITHMS
-from utils import InputValidator
+from utils import COLORS, LEGEND_ITEMS
 from .conftest import HeadlessTestMixin
 
 
@@ -18,63 +18,56 @@ from .conftest import HeadlessTestMixin
 class TestUIIntegration(HeadlessTestMixin):
     """Integration tests for UI components."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_frames(self, tk_root_clean):
         """Setup test environment."""
-        # Create safe root window
-        self.root = self.create_safe_root()
+        # Share the session's root window
+        self.root = tk_root_clean
         
         # Create test frames for each panel
         self.control_frame = tk.Frame(self.root)
         self.canvas_frame = tk.Frame(self.root)
         self.legend_frame = tk.Frame(self.root)
-    
-    def teardown_method(self):
-        """Clean up after tests."""
-        if hasattr(self, 'root'):
-            self.cleanup_root(self.root)
+        
+        yield
+        
+        # Clean up after tests; destroying a frame destroys its children
+        for frame in (self.control_frame, self.canvas_frame, self.legend_frame):
+            frame.destroy()
     
     def test_control_panel_creation(self):
         """Test ControlPanel can be created without errors."""
-        try:
-            control_panel = ControlPanel(self.control_frame)
-            
-            # Should have created the main frame
-            assert hasattr(control_panel, 'frame')
-            assert control_panel.frame.master == self.control_frame
-            
-            # Should have initialized callbacks as None
-            assert control_panel.on_algorithm_change is None
-            
-        except Exception as e:
-            pytest.fail(f"ControlPanel creation failed: {e}")
+        control_panel = ControlPanel(self.control_frame)
+        
+        # Should have created the main frame
+        assert hasattr(control_panel, 'frame')
+        assert control_panel.frame.master == self.control_frame
+        
+        # Should have initialized callbacks as None
+        assert control_panel.on_algorithm_change is None
+        
     
     def test_visualization_canvas_creation(self):
         """Test VisualizationCanvas can be created without errors."""
-        try:
-            canvas = VisualizationCanvas(self.canvas_frame)
-            
-            # Should have a canvas widget
-            assert hasattr(canvas, 'canvas')
-            assert isinstance(canvas.canvas, tk.Canvas)
-            
-            # Should be able to get the widget
-            widget = canvas.get_widget()
-            assert widget is not None
-            
-        except Exception as e:
-            pytest.fail(f"VisualizationCanvas creation failed: {e}")
+        canvas = VisualizationCanvas(self.canvas_frame)
+        
+        # Should have a canvas widget
+        assert hasattr(canvas, 'canvas')
+        assert isinstance(canvas.canvas, tk.Canvas)
+        
+        # Should be able to get the widget
+        widget = canvas.get_widget()
+        assert widget is not None
+        
     
     def test_legend_panel_creation(self):
         """Test LegendPanel can be created without errors."""
-        try:
-            legend_panel = LegendPanel(self.legend_frame)
-            
-            # Should have created main frame
-            assert hasattr(legend_panel, 'frame')
-            assert legend_panel.frame.master == self.legend_frame
-            
-        except Exception as e:
-            pytest.fail(f"LegendPanel creation failed: {e}")
+        legend_panel = LegendPanel(self.legend_frame)
+        
+        # Should have created main frame
+        assert hasattr(legend_panel, 'frame')
+        assert legend_panel.frame.master == self.legend_frame
+        
     
     def test_control_panel_callback_setting(self):
         """Test ControlPanel callback functionality."""
@@ -101,70 +94,112 @@ class TestUIIntegration(HeadlessTestMixin):
         assert control_panel.on_pause == pause_callback
         assert control_panel.on_reset == reset_callback
         assert control_panel.on_speed_change == speed_callback
-    
+
+    def test_speed_slider_debounced(self):
+        """Test a slider drag notifies only the final speed."""
+        control_panel = ControlPanel(self.control_frame)
+        speed_callback = Mock()
+        control_panel.set_speed_change_callback(speed_callback)
+
+        with patch.object(control_panel.frame, "after", side_effect=["a1", "a2"]) as after, \
+                patch.object(control_panel.frame, "after_cancel") as after_cancel:
+            control_panel._on_speed_change("1.5")
+            control_panel._on_speed_change("2.0")
+            # Repeating the shown speed does not restart the wait
+            control_panel._on_speed_change("2.0")
+
+        assert after.call_count == 2
+        # The first pending update is dropped and nothing fires mid-drag
+        after_cancel.assert_called_once_with("a1")
+        speed_callback.assert_not_called()
+
+        # Running the last scheduled update notifies the settled speed once
+        _, callback, speed = after.call_args.args
+        callback(speed)
+        speed_callback.assert_called_once_with(2.0)
+
     def test_visualization_canvas_array_handling(self):
         """Test VisualizationCanvas array operations."""
         canvas = VisualizationCanvas(self.canvas_frame)
         
-        # Test setting array
-        test_array = [3, 1, 4, 1, 5]
-        try:
+        # Only the canvas state is checked, so skip the actual drawing
+        with patch.object(canvas.canvas, "create_rectangle"), \
+                patch.object(canvas.canvas, "create_text"), \
+                patch.object(canvas.canvas, "delete"), \
+                patch.object(canvas.canvas, "coords"), \
+                patch.object(canvas.canvas, "itemconfig"):
+            # Test setting array
+            test_array = [3, 1, 4, 1, 5]
             canvas.set_array(test_array)
             # Should not crash
-        except Exception as e:
-            pytest.fail(f"set_array failed: {e}")
-        
-        # Test update animation (basic call)
-        try:
+            
+            # Test update animation (basic call)
             canvas.update_animation("compare", [0, 1], "Test comparison")
             # Should not crash
-        except Exception as e:
-            pytest.fail(f"update_animation failed: {e}")
-    
+
+            # Range comparisons highlight the whole span plus the pivot
+            canvas.update_animation("compare_range", [0, 2, 4], "Test range comparison")
+            assert canvas.comparing_indices == {0, 1, 2, 4}
+
+    def test_visualization_canvas_reuses_bar_items(self):
+        """Test animation frames move the existing bar items."""
+        canvas = VisualizationCanvas(self.canvas_frame)
+        canvas.set_array([3, 1, 4, 1, 5])
+        items = canvas.canvas.find_all()
+
+        for frame in range(8):
+            canvas.update_animation("swap", [0, 2], "Test swap", {
+                "progress": frame / 8, "is_final_frame": frame == 7})
+
+        # Swapping bars are raised, so compare the items regardless of order
+        assert sorted(canvas.canvas.find_all()) == sorted(items)
+        assert canvas.array == [4, 1, 3, 1, 5]
+        assert canvas.canvas.itemcget(canvas.bar_texts[0], "text") == "4"
+
     def test_legend_panel_message_handling(self):
         """Test LegendPanel message functionality."""
         legend_panel = LegendPanel(self.legend_frame)
         
-        # Test showing completion message
-        try:
+        # Skip the label redraws and the scheduled colour flash
+        with patch.object(legend_panel.completion_label, "config") as completion_config, \
+                patch.object(legend_panel.stats_label, "config"), \
+                patch.object(legend_panel.frame, "after"):
+            # Test showing completion message
             legend_panel.show_completion_message("Test Complete!")
             # Should not crash
-        except Exception as e:
-            pytest.fail(f"show_completion_message failed: {e}")
-        
-        # Test clearing messages
-        try:
+            completion_config.assert_any_call(text="Test Complete!", fg=COLORS["SUCCESS"])
+            
+            # Test clearing messages
             legend_panel.clear_messages()
             # Should not crash
-        except Exception as e:
-            pytest.fail(f"clear_messages failed: {e}")
+            completion_config.assert_called_with(text="")
+
+    def test_legend_items_drawn_on_one_canvas(self):
+        """Test every legend entry is a swatch and label on a single canvas."""
+        legend_panel = LegendPanel(self.legend_frame)
+
+        items = legend_panel.legend_canvas.find_all()
+        assert len(items) == 2 * len(LEGEND_ITEMS)
+        labels = [legend_panel.legend_canvas.itemcget(item, "text")
+                  for item in legend_panel.legend_canvas.find_withtag("all")
+                  if legend_panel.legend_canvas.type(item) == "text"]
+        assert labels == [label for label, _ in LEGEND_ITEMS]
 
 
 @pytest.mark.gui
 class TestUIComponentInteraction(HeadlessTestMixin):
     """Test interactions between UI components."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_components(self, tk_root_clean, panels_clean):
         """Setup test environment with all components."""
-        self.root = self.create_safe_root()
+        self.root = tk_root_clean
         
-        # Create frames
-        self.control_frame = tk.Frame(self.root)
-        self.canvas_frame = tk.Frame(self.root) 
-        self.legend_frame = tk.Frame(self.root)
-        
-        # Create panels
-        self.control_panel = ControlPanel(self.control_frame)
-        self.canvas = VisualizationCanvas(self.canvas_frame)
-        self.legend_panel = LegendPanel(self.legend_frame)
+        # Panels are built once for the class and reset between tests
+        self.control_panel, self.canvas, self.legend_panel = panels_clean
         
         # Track callback calls
         self.callback_calls = []
-        
-    def teardown_method(self):
-        """Clean up."""
-        if hasattr(self, 'root'):
-            self.cleanup_root(self.root)
     
     def test_algorithm_selection_flow(self):
         """Test the flow from algorithm selection to visualization setup."""
@@ -240,81 +275,23 @@ class TestUIComponentInteraction(HeadlessTestMixin):
         assert 'reset' in self.callback_calls
 
 
-class TestInputValidationIntegration:
-    """Test integration with input validation."""
-    
-    def setup_method(self):
-        """Setup test environment."""
-        pass  # No GUI needed for input validation
-        self.control_frame = tk.Frame(self.root)
-    
-    def teardown_method(self):
-        """Clean up."""
-        if hasattr(self, 'root'):
-            self.cleanup_root(self.root)
-    
-    def test_input_validator_integration(self):
-        """Test that InputValidator integrates properly with UI."""
-        # Test valid input
-        valid_input = "1,2,3,4,5"
-        is_valid, numbers, error = InputValidator.validate_input(valid_input)
-        
-        assert is_valid is True
-        assert numbers == [1, 2, 3, 4, 5]
-        assert error is None
-        
-        # Test invalid input
-        invalid_input = "1,abc,3"
-        is_valid, numbers, error = InputValidator.validate_input(invalid_input)
-        
-        assert is_valid is False
-        assert numbers is None
-        assert error is not None
-        assert isinstance(error, str)
-        assert len(error) > 0
-    
-    def test_array_size_validation(self):
-        """Test array size validation."""
-        # Test valid size
-        assert InputValidator.validate_array_size(10) is True
-        assert InputValidator.validate_array_size(50) is True
-        
-        # Test invalid sizes  
-        assert InputValidator.validate_array_size(0) is False
-        assert InputValidator.validate_array_size(-1) is False
-        assert InputValidator.validate_array_size(1000) is False
-    
-    def test_validation_messages(self):
-        """Test validation message generation."""
-        test_numbers = [5, 2, 8, 1, 9]
-        message = InputValidator.get_validation_message(test_numbers)
-        
-        assert isinstance(message, str)
-        assert len(message) > 0
-        assert "5 elements" in message or "5" in message
-        
-        # Test formatting
-        formatted = InputValidator.format_input(test_numbers)
-        assert isinstance(formatted, str)
-        assert "5" in formatted
-        assert "2" in formatted
-
-
 @pytest.mark.gui  
 class TestErrorHandling(HeadlessTestMixin):
     """Test error handling in UI components."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_frames(self, tk_root_clean):
         """Setup test environment."""
-        self.root = self.create_safe_root()
+        self.root = tk_root_clean
         self.control_frame = tk.Frame(self.root)
         self.canvas_frame = tk.Frame(self.root)
         self.legend_frame = tk.Frame(self.root)
-    
-    def teardown_method(self):
-        """Clean up."""
-        if hasattr(self, 'root'):
-            self.cleanup_root(self.root)
+        
+        yield
+        
+        # Clean up
+        for frame in (self.control_frame, self.canvas_frame, self.legend_frame):
+            frame.destroy()
     
     def test_canvas_with_invalid_data(self):
         """Test canvas behavior with invalid data."""
@@ -326,15 +303,10 @@ class TestErrorHandling(HeadlessTestMixin):
             # Should either handle gracefully or have clear error
         except (TypeError, AttributeError):
             pass  # Expected behavior
-        except Exception as e:
-            pytest.fail(f"Unexpected error with None array: {e}")
         
         # Test with empty array
-        try:
-            canvas.set_array([])
-            # Should handle empty array gracefully
-        except Exception as e:
-            pytest.fail(f"Failed to handle empty array: {e}")
+        canvas.set_array([])
+        # Should handle empty array gracefully
     
     def test_legend_panel_error_handling(self):
         """Test LegendPanel error handling."""
@@ -349,11 +321,8 @@ class TestErrorHandling(HeadlessTestMixin):
             pass
         
         # Test with empty message
-        try:
-            legend_panel.show_completion_message("")
-            # Should handle gracefully
-        except Exception as e:
-            pytest.fail(f"Failed to handle empty message: {e}")
+        legend_panel.show_completion_message("")
+        # Should handle gracefully
 
 
 if __name__ == "__main__":
@@ -1,5 +1,24 @@
+from importlib import import_module
+
 __all__ = ["ControlPanel", "VisualizationCanvas", "LegendPanel"]
 
-from .control_panel import ControlPanel
-from .visualization_canvas import VisualizationCanvas
-from .legend_panel import LegendPanel
+# Panels are imported on first use, so importing ui alone stays cheap
+_SUBMODULES = {
+    "ControlPanel": "control_panel",
+    "VisualizationCanvas": "visualization_canvas",
+    "LegendPanel": "legend_panel",
+}
+
+
+def __getattr__(name):
+    try:
+        submodule = _SUBMODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{submodule}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
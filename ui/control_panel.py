@@ -1,4 +1,5 @@
 import tkinter as tk
+from tkinter import font as tkfont
 from tkinter import ttk
 import random
 from typing import List, Callable, Optional
@@ -12,12 +13,28 @@ from utils import (
     ANIMATION_SPEED_DEFAULT,
     ANIMATION_SPEED_MIN,
     ANIMATION_SPEED_MAX,
+    SIZE_DEBOUNCE_MS,
+    SPEED_DEBOUNCE_MS,
+    OPERATION_UPDATE_MS,
     VALUE_MIN,
     BUTTON_SYMBOLS,
     ALGORITHM_INFO,
     InputValidator,
 )
 
+# Width of a widget spanning the panel inside its 10px margins
+_FULL_WIDTH = CONTROL_PANEL_WIDTH - 20
+
+# The algorithm list is fixed, so each info block is formatted only once
+_COMPLEXITY_TEXT = {
+    name: (
+        f"Time: {info['time_complexity']}\n"
+        f"Space: {info['space_complexity']}\n\n"
+        f"{info['description']}"
+    )
+    for name, info in ALGORITHM_INFO.items()
+}
+
 
 class ControlPanel:
     """
@@ -27,6 +44,32 @@ class ControlPanel:
     speed control, and progress display.
     """
 
+    # Top to bottom: (widget attribute, place() options, space below it).
+    # Widgets go at x=10 unless their options say otherwise.
+    _LAYOUT = (
+        # Algorithm selection and info
+        ("algorithm_label", {}, 20),
+        ("algorithm_combo", {}, 50),
+        ("complexity_label", {"x": 15, "width": _FULL_WIDTH - 10, "height": 65}, 80),
+        # Array size
+        ("size_label", {}, 20),
+        ("size_scale", {"width": _FULL_WIDTH}, 40),
+        # Data input; the entry and its button share a row
+        ("random_button", {"width": _FULL_WIDTH}, 35),
+        ("custom_label", {}, 20),
+        ("custom_entry", {"width": 140}, 0),
+        ("custom_button", {"x": 160, "width": 50}, 35),
+        ("error_label", {"width": _FULL_WIDTH, "height": 30}, 40),
+        # Playback controls
+        ("controls_frame", {"width": _FULL_WIDTH, "height": 40}, 50),
+        # Speed control
+        ("speed_label", {}, 20),
+        ("speed_scale", {"width": _FULL_WIDTH}, 40),
+        # Progress
+        ("step_label", {"width": _FULL_WIDTH, "height": 20}, 25),
+        ("operation_label", {"width": _FULL_WIDTH, "height": 40}, 0),
+    )
+
     def __init__(self, parent: tk.Widget):
         """
         Initialize control panel.
@@ -52,16 +95,40 @@ class ControlPanel:
         # State
         self.current_array: List[int] = []
         self.is_playing = False
+        self._shown_algorithm: Optional[str] = None
+        self._shown_size = ARRAY_SIZE_DEFAULT
+        self._shown_speed = ANIMATION_SPEED_DEFAULT
+        self._shown_progress = (0, 0)
+        self._shown_operation = "Ready to start"
+        self._pending_operation = self._shown_operation
+        self._operation_after_id: Optional[str] = None
+
+        # Pending after() ids for the debounced slider callbacks
+        self._size_after_id: Optional[str] = None
+        self._speed_after_id: Optional[str] = None
 
         # Create UI elements
         self._create_widgets()
         self._setup_layout()
 
+        # The labels updated on every animation step are configured through
+        # Tcl directly, skipping config()'s option marshalling
+        self._tk_call = self.frame.tk.call
+        self._step_label_path = str(self.step_label)
+        self._operation_label_path = str(self.operation_label)
+
         # Initialize with random array
         self.generate_random_array()
 
     def _create_widgets(self):
         """Create all control widgets."""
+        # Named fonts are parsed by Tk once and shared by every widget
+        self._font_bold10 = tkfont.Font(
+            self.frame, family="Arial", size=10, weight="bold"
+        )
+        self._font_9 = tkfont.Font(self.frame, family="Arial", size=9)
+        self._font_8 = tkfont.Font(self.frame, family="Arial", size=8)
+        self._font_14 = tkfont.Font(self.frame, family="Arial", size=14)
 
         # Algorithm Selection
         self.algorithm_label = tk.Label(
@@ -69,7 +136,7 @@ class ControlPanel:
             text="Algorithm:",
             bg=COLORS["PANEL_BG"],
             fg=COLORS["TEXT"],
-            font=("Arial", 10, "bold"),
+            font=self._font_bold10,
         )
 
         self.algorithm_var = tk.StringVar()
@@ -83,13 +150,12 @@ class ControlPanel:
         self.algorithm_combo.bind("<<ComboboxSelected>>", self._on_algorithm_selected)
 
         # Algorithm Info Display
-        self.info_frame = tk.Frame(self.frame, bg=COLORS["PANEL_BG"])
         self.complexity_label = tk.Label(
-            self.info_frame,
+            self.frame,
             text="",
             bg=COLORS["PANEL_BG"],
             fg=COLORS["TEXT"],
-            font=("Arial", 8),
+            font=self._font_8,
             wraplength=200,
             justify="left",
         )
@@ -100,7 +166,7 @@ class ControlPanel:
             text=f"Array Size: {ARRAY_SIZE_DEFAULT}",
             bg=COLORS["PANEL_BG"],
             fg=COLORS["TEXT"],
-            font=("Arial", 9),
+            font=self._font_9,
         )
 
         self.size_var = tk.IntVar(value=ARRAY_SIZE_DEFAULT)
@@ -123,7 +189,7 @@ class ControlPanel:
             text="Generate Random",
             bg=COLORS["DEFAULT"],
             fg=COLORS["TEXT"],
-            font=("Arial", 9),
+            font=self._font_9,
             command=self.generate_random_array,
         )
 
@@ -132,10 +198,10 @@ class ControlPanel:
             text="Custom Input:",
             bg=COLORS["PANEL_BG"],
             fg=COLORS["TEXT"],
-            font=("Arial", 9),
+            font=self._font_9,
         )
 
-        self.custom_entry = tk.Entry(self.frame, width=20, font=("Arial", 9))
+        self.custom_entry = tk.Entry(self.frame, width=20, font=self._font_9)
         self.custom_entry.bind("<Return>", self._on_custom_input)
 
         self.custom_button = tk.Button(
@@ -143,7 +209,7 @@ class ControlPanel:
             text="Apply",
             bg=COLORS["SUCCESS"],
             fg=COLORS["TEXT"],
-            font=("Arial", 8),
+            font=self._font_8,
             command=self._on_custom_input,
         )
 
@@ -152,7 +218,7 @@ class ControlPanel:
             text="",
             bg=COLORS["PANEL_BG"],
             fg=COLORS["ERROR"],
-            font=("Arial", 8),
+            font=self._font_8,
             wraplength=200,
             justify="left",
         )
@@ -165,7 +231,7 @@ class ControlPanel:
             text=BUTTON_SYMBOLS["PLAY"],
             bg=COLORS["SUCCESS"],
             fg=COLORS["TEXT"],
-            font=("Arial", 14),
+            font=self._font_14,
             width=3,
             state="disabled",
             command=self._on_play_clicked,
@@ -176,7 +242,7 @@ class ControlPanel:
             text=BUTTON_SYMBOLS["PAUSE"],
             bg=COLORS["ERROR"],
             fg=COLORS["TEXT"],
-            font=("Arial", 14),
+            font=self._font_14,
             width=3,
             state="disabled",
             command=self._on_pause_clicked,
@@ -187,7 +253,7 @@ class ControlPanel:
             text=BUTTON_SYMBOLS["RESET"],
             bg=COLORS["BACKGROUND"],
             fg=COLORS["TEXT"],
-            font=("Arial", 14),
+            font=self._font_14,
             width=3,
             command=self._on_reset_clicked,
         )
@@ -198,7 +264,7 @@ class ControlPanel:
             text=f"Speed: {ANIMATION_SPEED_DEFAULT:.1f}x",
             bg=COLORS["PANEL_BG"],
             fg=COLORS["TEXT"],
-            font=("Arial", 9),
+            font=self._font_9,
         )
 
         self.speed_var = tk.DoubleVar(value=ANIMATION_SPEED_DEFAULT)
@@ -217,14 +283,12 @@ class ControlPanel:
         )
 
         # Progress Display
-        self.progress_frame = tk.Frame(self.frame, bg=COLORS["PANEL_BG"])
-
         self.step_label = tk.Label(
-            self.progress_frame,
+            self.frame,
             text="Step: 0 / 0",
             bg=COLORS["PANEL_BG"],
             fg=COLORS["TEXT"],
-            font=("Arial", 9),
+            font=self._font_9,
         )
 
         self.operation_label = tk.Label(
@@ -232,7 +296,7 @@ class ControlPanel:
             text="Ready to start",
             bg=COLORS["PANEL_BG"],
             fg=COLORS["TEXT"],
-            font=("Arial", 8),
+            font=self._font_8,
             wraplength=200,
             justify="left",
         )
@@ -240,72 +304,23 @@ class ControlPanel:
     def _setup_layout(self):
         """Arrange all widgets in the control panel."""
         y = CONTROL_Y_START
+        for name, options, advance in self._LAYOUT:
+            getattr(self, name).place(**{"x": 10, "y": y, **options})
+            y += advance
 
-        # Algorithm selection
-        self.algorithm_label.place(x=10, y=y)
-        y += 20
-        self.algorithm_combo.place(x=10, y=y)
-        y += 45  # More space after dropdown
-
-        # Algorithm info
-        self.info_frame.place(
-            x=10, y=y, width=CONTROL_PANEL_WIDTH - 20, height=75
-        )  # Increased height
-        self.complexity_label.pack(
-            fill="both", expand=True, padx=5, pady=5
-        )  # Added padding
-        y += 85  # More space after info
-
-        # Array size
-        self.size_label.place(x=10, y=y)
-        y += 20
-        self.size_scale.place(x=10, y=y, width=CONTROL_PANEL_WIDTH - 20)
-        y += 40
-
-        # Data input
-        self.random_button.place(x=10, y=y, width=CONTROL_PANEL_WIDTH - 20)
-        y += 35
-
-        self.custom_label.place(x=10, y=y)
-        y += 20
-        self.custom_entry.place(x=10, y=y, width=140)
-        self.custom_button.place(x=160, y=y, width=50)
-        y += 35
-
-        self.error_label.place(x=10, y=y, width=CONTROL_PANEL_WIDTH - 20, height=30)
-        y += 40
-
-        # Playback controls
-        self.controls_frame.place(x=10, y=y, width=CONTROL_PANEL_WIDTH - 20, height=40)
+        # The playback buttons sit side by side in their placed frame
         self.play_button.pack(side="left", padx=5)
         self.pause_button.pack(side="left", padx=5)
         self.reset_button.pack(side="left", padx=5)
-        y += 50
-
-        # Speed control
-        self.speed_label.place(x=10, y=y)
-        y += 20
-        self.speed_scale.place(x=10, y=y, width=CONTROL_PANEL_WIDTH - 20)
-        y += 40
-
-        # Progress
-        self.progress_frame.place(x=10, y=y, width=CONTROL_PANEL_WIDTH - 20, height=20)
-        self.step_label.pack()
-        y += 25
-
-        self.operation_label.place(x=10, y=y, width=CONTROL_PANEL_WIDTH - 20, height=40)
 
     def _on_algorithm_selected(self, event=None):
         """Handle algorithm selection change."""
         algorithm = self.algorithm_var.get()
-        if algorithm and algorithm in ALGORITHM_INFO:
-            info = ALGORITHM_INFO[algorithm]
-            complexity_text = (
-                f"Time: {info['time_complexity']}\n"
-                f"Space: {info['space_complexity']}\n\n"
-                f"{info['description']}"
-            )
-            self.complexity_label.config(text=complexity_text)
+        if algorithm and algorithm in _COMPLEXITY_TEXT:
+            # Reselecting the same algorithm leaves the info text unchanged
+            if algorithm != self._shown_algorithm:
+                self.complexity_label.config(text=_COMPLEXITY_TEXT[algorithm])
+                self._shown_algorithm = algorithm
 
             # Enable play button
             self.play_button.config(state="normal")
@@ -320,11 +335,28 @@ class ControlPanel:
     def _on_size_change(self, value):
         """Handle array size change."""
         size = int(float(value))
+        # Setting size_var from custom input reports the size already shown
+        if size == self._shown_size:
+            return
+        self._shown_size = size
         self.size_label.config(text=f"Array Size: {size}")
 
-        # If currently using random array, regenerate
+        # Regenerating redraws the whole canvas, so wait for the drag to settle
+        if self._size_after_id is not None:
+            self.frame.after_cancel(self._size_after_id)
+        self._size_after_id = self.frame.after(
+            SIZE_DEBOUNCE_MS, self._commit_size_change
+        )
+
+    def _commit_size_change(self):
+        """Apply the settled array size."""
+        self._size_after_id = None
+
+        # If currently using random array, regenerate; a drag that settles
+        # back on the current size keeps the array and its entry text
         if hasattr(self, "_last_was_random") and self._last_was_random:
-            self.generate_random_array()
+            if len(self.current_array) != self.size_var.get():
+                self.generate_random_array()
 
     def _on_custom_input(self, event=None):
         """Handle custom input submission."""
@@ -337,6 +369,7 @@ class ControlPanel:
             self.error_label.config(text="")
 
             # Update size slider to match input
+            self._shown_size = len(numbers)
             self.size_var.set(len(numbers))
             self.size_label.config(text=f"Array Size: {len(numbers)}")
 
@@ -367,9 +400,11 @@ class ControlPanel:
     def _on_play_clicked(self):
         """Handle play button click."""
         self.is_playing = True
-        self.play_button.config(state="disabled")
-        self.pause_button.config(state="normal")
-        self.algorithm_combo.config(state="disabled")
+        self._apply_states(
+            (self.play_button, "disabled"),
+            (self.pause_button, "normal"),
+            (self.algorithm_combo, "disabled"),
+        )
 
         if self.on_play:
             self.on_play()
@@ -377,8 +412,10 @@ class ControlPanel:
     def _on_pause_clicked(self):
         """Handle pause button click."""
         self.is_playing = False
-        self.play_button.config(state="normal")
-        self.pause_button.config(state="disabled")
+        self._apply_states(
+            (self.play_button, "normal"),
+            (self.pause_button, "disabled"),
+        )
 
         if self.on_pause:
             self.on_pause()
@@ -386,11 +423,11 @@ class ControlPanel:
     def _on_reset_clicked(self):
         """Handle reset button click."""
         self.is_playing = False
-        self.play_button.config(
-            state="normal" if self.algorithm_var.get() else "disabled"
+        self._apply_states(
+            (self.play_button, "normal" if self.algorithm_var.get() else "disabled"),
+            (self.pause_button, "disabled"),
+            (self.algorithm_combo, "readonly"),
         )
-        self.pause_button.config(state="disabled")
-        self.algorithm_combo.config(state="readonly")
 
         # Reset progress display
         self.update_progress(0, 0)
@@ -399,21 +436,68 @@ class ControlPanel:
         if self.on_reset:
             self.on_reset()
 
+    @staticmethod
+    def _apply_states(*states):
+        """
+        Set the state of several widgets for one playback transition.
+
+        Args:
+            states: (widget, state) pairs, applied in order
+        """
+        for widget, state in states:
+            widget.config(state=state)
+
     def _on_speed_change(self, value):
         """Handle speed change."""
         speed = float(value)
+        # Pointer jitter within one 0.1 step reports the same speed again
+        if speed == self._shown_speed:
+            return
+        self._shown_speed = speed
         self.speed_label.config(text=f"Speed: {speed:.1f}x")
 
+        if self._speed_after_id is not None:
+            self.frame.after_cancel(self._speed_after_id)
+        self._speed_after_id = self.frame.after(
+            SPEED_DEBOUNCE_MS, self._commit_speed_change, speed
+        )
+
+    def _commit_speed_change(self, speed: float):
+        """Notify the settled animation speed."""
+        self._speed_after_id = None
+
         if self.on_speed_change:
             self.on_speed_change(speed)
 
     def update_progress(self, current: int, total: int):
         """Update progress display."""
-        self.step_label.config(text=f"Step: {current} / {total}")
+        # Called every animation frame; only touch the label on a change
+        if (current, total) == self._shown_progress:
+            return
+        self._shown_progress = (current, total)
+        self._tk_call(
+            self._step_label_path, "configure", "-text", f"Step: {current} / {total}"
+        )
 
     def update_operation(self, description: str):
         """Update current operation description."""
-        self.operation_label.config(text=description)
+        self._pending_operation = description
+        # Show it right away unless a recent update is still on screen;
+        # then the latest description is shown when that interval ends
+        if self._operation_after_id is None:
+            self._flush_operation()
+
+    def _flush_operation(self):
+        """Show the latest operation description if it changed."""
+        description = self._pending_operation
+        if description == self._shown_operation:
+            self._operation_after_id = None
+            return
+        self._shown_operation = description
+        self._tk_call(self._operation_label_path, "configure", "-text", description)
+        self._operation_after_id = self.frame.after(
+            OPERATION_UPDATE_MS, self._flush_operation
+        )
 
     def set_algorithm_change_callback(self, callback: Callable[[str], None]):
         """Set callback for algorithm changes."""
@@ -441,7 +525,9 @@ class ControlPanel:
     def on_animation_complete(self):
         """Handle animation completion."""
         self.is_playing = False
-        self.play_button.config(state="normal")
-        self.pause_button.config(state="disabled")
-        self.algorithm_combo.config(state="readonly")
+        self._apply_states(
+            (self.play_button, "normal"),
+            (self.pause_button, "disabled"),
+            (self.algorithm_combo, "readonly"),
+        )
         self.update_operation("Sort complete!")
@@ -1,6 +1,15 @@
 import tkinter as tk
+from tkinter import font as tkfont
 from utils import COLORS, LEGEND_PANEL_WIDTH, LEGEND_ITEMS
 
+# Statistics shown after a sort, in display order: (stats key, line template)
+_STAT_LINES = (
+    ("total_steps", "Steps: {}\n"),
+    ("comparisons", "Comparisons: {}\n"),
+    ("swaps", "Swaps: {}\n"),
+    ("time_taken", "Time: {:.2f}s\n"),
+)
+
 
 class LegendPanel:
     """
@@ -24,12 +33,22 @@ class LegendPanel:
         self.frame.pack(fill="both", expand=True)
         self.frame.pack_propagate(False)  # Maintain fixed width
 
+        self._shown_stats = ""
+
         # Create widgets
         self._create_widgets()
         self._setup_layout()
 
     def _create_widgets(self):
         """Create legend widgets."""
+        # Named fonts are parsed by Tk once and shared by every widget
+        self._font_bold10 = tkfont.Font(
+            self.frame, family="Arial", size=10, weight="bold"
+        )
+        self._font_bold12 = tkfont.Font(
+            self.frame, family="Arial", size=12, weight="bold"
+        )
+        self._font_8 = tkfont.Font(self.frame, family="Arial", size=8)
 
         # Legend title
         self.title_label = tk.Label(
@@ -37,40 +56,32 @@ class LegendPanel:
             text="Legend",
             bg=COLORS["PANEL_BG"],
             fg=COLORS["TEXT"],
-            font=("Arial", 10, "bold"),
+            font=self._font_bold10,
         )
 
-        # Color legend items
-        self.legend_items = []
-        for label, color in LEGEND_ITEMS:
-            # Create frame for each legend item
-            item_frame = tk.Frame(self.frame, bg=COLORS["PANEL_BG"])
-
-            # Color square
-            color_canvas = tk.Canvas(
-                item_frame,
-                width=20,
-                height=15,
-                bg=color,
-                highlightthickness=1,
-                highlightbackground=COLORS["TEXT"],
+        # Color legend items, drawn as items on one canvas rather than a
+        # frame, swatch and label widget per entry
+        self.legend_canvas = tk.Canvas(
+            self.frame,
+            width=LEGEND_PANEL_WIDTH - 20,
+            height=25 * len(LEGEND_ITEMS),
+            bg=COLORS["PANEL_BG"],
+            highlightthickness=0,
+        )
+        for i, (label, color) in enumerate(LEGEND_ITEMS):
+            top = i * 25
+            self.legend_canvas.create_rectangle(
+                1, top + 2, 21, top + 17, fill=color, outline=COLORS["TEXT"]
             )
-
-            # Label
-            label_widget = tk.Label(
-                item_frame,
+            self.legend_canvas.create_text(
+                27,
+                top + 10,
                 text=label,
-                bg=COLORS["PANEL_BG"],
-                fg=COLORS["TEXT"],
-                font=("Arial", 8),
+                anchor="w",
+                fill=COLORS["TEXT"],
+                font=self._font_8,
             )
 
-            # Pack within item frame
-            color_canvas.pack(side="left", padx=(0, 5))
-            label_widget.pack(side="left", fill="x", expand=True)
-
-            self.legend_items.append((item_frame, color_canvas, label_widget))
-
         # Completion message area
         self.completion_frame = tk.Frame(self.frame, bg=COLORS["PANEL_BG"])
 
@@ -79,7 +90,7 @@ class LegendPanel:
             text="",
             bg=COLORS["PANEL_BG"],
             fg=COLORS["SUCCESS"],
-            font=("Arial", 12, "bold"),
+            font=self._font_bold12,
             wraplength=LEGEND_PANEL_WIDTH - 20,
             justify="center",
         )
@@ -92,7 +103,7 @@ class LegendPanel:
             text="",
             bg=COLORS["PANEL_BG"],
             fg=COLORS["TEXT"],
-            font=("Arial", 8),
+            font=self._font_8,
             wraplength=LEGEND_PANEL_WIDTH - 20,
             justify="left",
         )
@@ -106,9 +117,8 @@ class LegendPanel:
         y += 30
 
         # Legend items
-        for item_frame, _, _ in self.legend_items:
-            item_frame.place(x=10, y=y, width=LEGEND_PANEL_WIDTH - 20, height=20)
-            y += 25
+        self.legend_canvas.place(x=10, y=y)
+        y += 25 * len(LEGEND_ITEMS)
 
         # Add some spacing
         y += 20
@@ -132,7 +142,7 @@ class LegendPanel:
             text="",
             bg=COLORS["PANEL_BG"],
             fg=COLORS["TEXT"],
-            font=("Arial", 8),
+            font=self._font_8,
             wraplength=LEGEND_PANEL_WIDTH - 30,
             justify="left",
         )
@@ -145,13 +155,7 @@ class LegendPanel:
         Args:
             message: Message to display
         """
-        self.completion_label.config(text=message)
-
-        # Flash the message by temporarily changing color
-        self.completion_label.config(fg=COLORS["SUCCESS"])
-        self.frame.after(
-            100, lambda: self.completion_label.config(fg=COLORS["SUCCESS"])
-        )
+        self.completion_label.config(text=message, fg=COLORS["SUCCESS"])
 
     def show_statistics(self, stats: dict):
         """
@@ -160,23 +164,21 @@ class LegendPanel:
         Args:
             stats: Dictionary containing statistics like steps, comparisons, swaps
         """
-        stats_text = ""
-
-        if "total_steps" in stats:
-            stats_text += f"Steps: {stats['total_steps']}\n"
-        if "comparisons" in stats:
-            stats_text += f"Comparisons: {stats['comparisons']}\n"
-        if "swaps" in stats:
-            stats_text += f"Swaps: {stats['swaps']}\n"
-        if "time_taken" in stats:
-            stats_text += f"Time: {stats['time_taken']:.2f}s\n"
+        stats_text = "".join(
+            template.format(stats[key]) for key, template in _STAT_LINES if key in stats
+        )
+        self._set_stats_text(stats_text)
 
-        self.stats_label.config(text=stats_text)
+    def _set_stats_text(self, text: str):
+        """Update the statistics label unless it already shows this text."""
+        if text != self._shown_stats:
+            self._shown_stats = text
+            self.stats_label.config(text=text)
 
     def clear_messages(self):
         """Clear completion message and statistics."""
         self.completion_label.config(text="")
-        self.stats_label.config(text="")
+        self._set_stats_text("")
         
     def show_algorithm_info(self, algorithm_instance):
         """
@@ -203,17 +205,14 @@ class LegendPanel:
     def flash_completion(self):
         """Flash the completion message for celebratory effect."""
         original_bg = self.completion_label.cget("bg")
-        flash_color = COLORS["SUCCESS"]
-
-        def flash_sequence(step=0):
-            if step < 6:  # Flash 3 times
-                color = flash_color if step % 2 == 0 else original_bg
-                self.completion_frame.config(bg=color)
-                self.frame.after(200, lambda: flash_sequence(step + 1))
-            else:
-                self.completion_frame.config(bg=original_bg)
-
-        flash_sequence()
+        # Flash 3 times, then settle back on the original background
+        self._flash_step(0, (COLORS["SUCCESS"], original_bg) * 3)
+
+    def _flash_step(self, step: int, colors: tuple):
+        """Show one colour of the completion flash and schedule the next."""
+        self.completion_frame.config(bg=colors[step])
+        if step + 1 < len(colors):
+            self.frame.after(200, self._flash_step, step + 1, colors)
 
     def get_widget(self) -> tk.Frame:
         """Get the legend panel frame."""
@@ -1,5 +1,6 @@
 import tkinter as tk
-from typing import List, Dict, Any, Optional, Set
+from tkinter import font as tkfont
+from typing import List, Dict, Any, Optional, Sequence, Set, Tuple
 from utils import (
     COLORS,
     VISUALIZATION_CANVAS_WIDTH,
@@ -9,6 +10,12 @@ from utils import (
     BAR_TEXT_OFFSET,
 )
 
+# Bar colors, looked up once since every bar of every frame needs one
+_SORTED_COLOR = COLORS["SORTED"]
+_SWAPPING_COLOR = COLORS["SWAPPING"]
+_COMPARING_COLOR = COLORS["COMPARING"]
+_DEFAULT_COLOR = COLORS["DEFAULT"]
+
 
 class VisualizationCanvas:
     """
@@ -36,13 +43,15 @@ class VisualizationCanvas:
             highlightthickness=0,
         )
 
+        # Every bar redraw labels its value; share one named font for them
+        self._value_font = tkfont.Font(self.canvas, family="Arial", size=8)
+
         # State management
         self.array: List[int] = []
-        self.bar_states: Dict[int, str] = (
-            {}
-        )  # index -> state ('default', 'comparing', etc.)
-        self.bar_rects: List[Optional[int]] = []  # Canvas rectangle IDs
-        self.bar_texts: List[Optional[int]] = []  # Canvas text IDs
+        self.bar_rects: List[int] = []  # Canvas rectangle IDs
+        self.bar_texts: List[int] = []  # Canvas text IDs
+        # (value, x offset, color) each bar's items currently show
+        self._bar_shown: List[Tuple[Optional[int], Optional[float], str]] = []
 
         # Animation state for smooth transitions
         self.animation_data: Dict[int, Dict[str, Any]] = {}  # index -> animation info
@@ -54,6 +63,9 @@ class VisualizationCanvas:
         self.bar_width = 0
         self.max_bar_height = 0
         self.base_y = 0
+        # Smallest value and value spread, which scale every bar's height
+        self._value_min = 0
+        self._value_range = 0
 
     def set_array(self, array: List[int]):
         """
@@ -63,7 +75,7 @@ class VisualizationCanvas:
             array: List of integers to visualize
         """
         self.array = array.copy()
-        self.bar_states = {i: "default" for i in range(len(array))}
+        self._update_value_range()
 
         # Clear animation state
         self.animation_data.clear()
@@ -74,8 +86,9 @@ class VisualizationCanvas:
         # Calculate layout
         self._calculate_layout()
 
-        # Draw initial bars
-        self.draw_bars()
+        # Draw initial bars; a new array can change every bar's height scale,
+        # so its items are always built from scratch
+        self._create_bars()
 
     def _calculate_layout(self):
         """Calculate bar dimensions and positions based on array size."""
@@ -93,6 +106,29 @@ class VisualizationCanvas:
         self.max_bar_height = CANVAS_HEIGHT - (2 * CANVAS_PADDING) - 20
         self.base_y = CANVAS_HEIGHT - CANVAS_PADDING
 
+    def _update_value_range(self):
+        """Cache the value range used to scale bar heights."""
+        if self.array:
+            self._value_min = min(self.array)
+            self._value_range = max(self.array) - self._value_min
+        else:
+            self._value_min = self._value_range = 0
+
+    def _replace_values(self, values: List[int]):
+        """
+        Take over a new array state reported by the algorithm.
+
+        The list is kept as is rather than copied, so callers pass one they
+        do not hold on to. Sorting only reorders values, so the height
+        scale normally stays the same; if it does change, every bar is
+        marked for a full redraw.
+        """
+        scale = (self._value_min, self._value_range)
+        self.array = values
+        self._update_value_range()
+        if (self._value_min, self._value_range) != scale:
+            self._bar_shown = [(None, None, color) for _, _, color in self._bar_shown]
+
     def _get_bar_x(self, index: int) -> int:
         """Get X position for bar at given index."""
         return CANVAS_PADDING + index * (self.bar_width + BAR_SPACING)
@@ -101,89 +137,116 @@ class VisualizationCanvas:
         """Get height for bar with given value."""
         if not self.array:
             return 0
-        max_value = max(self.array)
-        min_value = min(self.array)
-        value_range = max_value - min_value
+        # The range is cached, so drawing n bars no longer scans the array n times
+        value_range = self._value_range
 
         if value_range == 0:
             return self.max_bar_height // 2
 
-        normalized = (value - min_value) / value_range
+        normalized = (value - self._value_min) / value_range
         return max(10, int(normalized * self.max_bar_height))
 
     def _get_bar_color(self, index: int) -> str:
         """Get current color for bar at given index."""
         if index in self.sorted_indices:
-            return COLORS["SORTED"]
+            return _SORTED_COLOR
         elif index in self.swapping_indices:
-            return COLORS["SWAPPING"]
+            return _SWAPPING_COLOR
         elif index in self.comparing_indices:
-            return COLORS["COMPARING"]
+            return _COMPARING_COLOR
         else:
-            return COLORS["DEFAULT"]
+            return _DEFAULT_COLOR
 
     def draw_bars(self):
-        """Draw all bars on the canvas."""
-        # Clear canvas
-        self.canvas.delete("all")
-
-        if not self.array:
+        """Draw all bars, moving the existing canvas items when possible."""
+        if len(self.bar_rects) != len(self.array):
+            self._create_bars()
             return
 
-        # Reset ID lists
-        self.bar_rects = [None] * len(self.array)
-        self.bar_texts = [None] * len(self.array)
-
-        # Draw each bar
         for i, value in enumerate(self.array):
             self._draw_single_bar(i, value)
 
-    def _draw_single_bar(self, index: int, value: int, x_offset: float = 0):
+    def _create_bars(self):
+        """Replace the canvas contents with a rectangle and label per bar."""
+        self.canvas.delete("all")
+        self.bar_rects = []
+        self.bar_texts = []
+        self._bar_shown = []
+
+        for i, value in enumerate(self.array):
+            rect, text = self._bar_coords(i, value)
+            color = self._get_bar_color(i)
+            self._bar_shown.append((value, 0, color))
+            self.bar_rects.append(
+                self.canvas.create_rectangle(
+                    *rect,
+                    fill=color,
+                    outline=COLORS["TEXT"],
+                    width=1,
+                )
+            )
+            self.bar_texts.append(
+                self.canvas.create_text(
+                    *text,
+                    text=str(value),
+                    fill=COLORS["TEXT"],
+                    font=self._value_font,
+                    anchor="s",
+                )
+            )
+
+    def _bar_coords(self, index: int, value: int, x_offset: float = 0):
         """
-        Draw a single bar with optional position offset for animations.
+        Get canvas coordinates for a bar and its value label.
 
         Args:
             index: Bar index
             value: Bar value
             x_offset: Additional X offset for animation
+
+        Returns:
+            Tuple of (rectangle corners, label anchor point)
         """
         x = self._get_bar_x(index) + x_offset
-        height = self._get_bar_height(value)
-        y = self.base_y - height
-        color = self._get_bar_color(index)
-
-        # Draw rectangle
-        rect_id = self.canvas.create_rectangle(
-            x,
-            y,
-            x + self.bar_width,
-            self.base_y,
-            fill=color,
-            outline=COLORS["TEXT"],
-            width=1,
+        y = self.base_y - self._get_bar_height(value)
+        return (
+            (x, y, x + self.bar_width, self.base_y),
+            (x + self.bar_width // 2, y - BAR_TEXT_OFFSET),
         )
 
-        # Draw value text
-        text_x = x + self.bar_width // 2
-        text_y = y - BAR_TEXT_OFFSET
-        text_id = self.canvas.create_text(
-            text_x,
-            text_y,
-            text=str(value),
-            fill=COLORS["TEXT"],
-            font=("Arial", 8),
-            anchor="s",
-        )
+    def _draw_single_bar(self, index: int, value: int, x_offset: float = 0):
+        """
+        Move and recolor a bar's existing canvas items to show its value.
+
+        Items are updated in place rather than deleted and recreated, and
+        only the parts that differ from what the bar already shows are sent
+        to Tk, so an unchanged bar costs no canvas commands at all.
+
+        Args:
+            index: Bar index
+            value: Bar value
+            x_offset: Additional X offset for animation
+        """
+        color = self._get_bar_color(index)
+        shown_value, shown_offset, shown_color = self._bar_shown[index]
+        rect_id = self.bar_rects[index]
+        text_id = self.bar_texts[index]
+
+        if value != shown_value or x_offset != shown_offset:
+            rect, text = self._bar_coords(index, value, x_offset)
+            self.canvas.coords(rect_id, *rect)
+            self.canvas.coords(text_id, *text)
+            if value != shown_value:
+                self.canvas.itemconfig(text_id, text=str(value))
+        if color != shown_color:
+            self.canvas.itemconfig(rect_id, fill=color)
 
-        # Store IDs
-        if index < len(self.bar_rects):
-            self.bar_rects[index] = rect_id
-            self.bar_texts[index] = text_id
+        self._bar_shown[index] = (value, x_offset, color)
 
     def update_animation(
         self,
         action: str,
-        indices: List[int],
+        indices: Sequence[int],
         description: str,
         animation_data: Optional[Dict[str, Any]] = None,
     ):
@@ -205,32 +268,38 @@ class VisualizationCanvas:
         # Check if algorithm provides updated array state
         if "array_state" in animation_data and is_final_frame:
             # Update our array to match the algorithm's current state
-            self.array = animation_data["array_state"].copy()
+            # The state belongs to the caller, so keep a copy of it
+            self._replace_values(list(animation_data["array_state"]))
 
         # Handle different action types
         if action == "compare":
             self._handle_compare(indices, progress, is_final_frame)
+        elif action == "compare_range":
+            indices = self._handle_compare_range(indices, progress, is_final_frame)
         elif action == "swap":
             self._handle_swap(indices, progress, is_final_frame)
-        elif action in ["mark_sorted", "sorted"]:
+        elif action in ["mark_sorted", "sorted", "run_detected"]:
+            # Runs found by merge sort are already in order
             self._handle_mark_sorted(indices)
         elif action in ["highlight_pivot", "highlight_current", "highlight_min"]:
             self._handle_highlight(indices, progress, is_final_frame)
         elif action == "reset":
             self._handle_reset()
-        elif action == "array_update":
-            # Handle array state update from algorithms
-            self._handle_array_update(indices, progress, is_final_frame, description)
         elif action in ["divide", "merge_start", "place", "insert", "shift"]:
             # Handle merge sort specific actions
             self._handle_merge_actions(action, indices, progress, is_final_frame)
 
         # Redraw if this is a final frame or for certain actions
-        if is_final_frame or action in ["reset", "mark_sorted", "array_update"]:
+        if is_final_frame or action in [
+            "reset",
+            "mark_sorted",
+            "run_detected",
+            "array_update",
+        ]:
             self._redraw_affected_bars(indices)
 
     def _handle_compare(
-        self, indices: List[int], progress: float, is_final_frame: bool
+        self, indices: Sequence[int], progress: float, is_final_frame: bool
     ):
         """Handle comparison highlighting."""
         if is_final_frame:
@@ -239,7 +308,32 @@ class VisualizationCanvas:
             # Add current comparisons
             self.comparing_indices.update(indices)
 
-    def _handle_swap(self, indices: List[int], progress: float, is_final_frame: bool):
+    def _handle_compare_range(
+        self, indices: Sequence[int], progress: float, is_final_frame: bool
+    ) -> List[int]:
+        """
+        Handle highlighting a span of elements compared against one element.
+
+        Args:
+            indices: [first, last, other] where first..last is the compared span
+
+        Returns:
+            Every index the step highlights, so all of them get redrawn
+        """
+        if len(indices) != 3:
+            return list(indices)
+
+        first, last, other = indices
+        affected = list(range(first, last + 1))
+        affected.append(other)
+        if is_final_frame:
+            self.comparing_indices.clear()
+            self.comparing_indices.update(affected)
+        return affected
+
+    def _handle_swap(
+        self, indices: Sequence[int], progress: float, is_final_frame: bool
+    ):
         """Handle swapping animation with interpolation."""
         if len(indices) != 2:
             return
@@ -249,6 +343,11 @@ class VisualizationCanvas:
         if progress == 0.0:
             # Start of swap - mark as swapping
             self.swapping_indices.update(indices)
+            # Keep the moving bars above the ones they pass over
+            if max(idx1, idx2) < len(self.bar_rects):
+                for idx in indices:
+                    self.canvas.tag_raise(self.bar_rects[idx])
+                    self.canvas.tag_raise(self.bar_texts[idx])
             self.comparing_indices.discard(idx1)
             self.comparing_indices.discard(idx2)
         elif is_final_frame:
@@ -260,7 +359,7 @@ class VisualizationCanvas:
             # Mid-swap - animate positions
             self._animate_swap_positions(idx1, idx2, progress)
 
-    def _handle_mark_sorted(self, indices: List[int]):
+    def _handle_mark_sorted(self, indices: Sequence[int]):
         """Handle marking elements as sorted."""
         self.sorted_indices.update(indices)
         # Remove from other states
@@ -269,34 +368,12 @@ class VisualizationCanvas:
             self.swapping_indices.discard(idx)
 
     def _handle_highlight(
-        self, indices: List[int], progress: float, is_final_frame: bool
+        self, indices: Sequence[int], progress: float, is_final_frame: bool
     ):
         """Handle general highlighting (pivot, current element, etc.)."""
         if is_final_frame:
             self.comparing_indices.update(indices)
 
-    def _handle_array_update(
-        self,
-        indices: List[int],
-        progress: float,
-        is_final_frame: bool,
-        description: str,
-    ):
-        """Handle array state updates from algorithms."""
-        if is_final_frame and "Array updated:" in description:
-            # Extract the new array state from the description
-            try:
-                # Parse the array from the description string
-                import ast
-
-                array_str = description.split("Array updated: ")[1]
-                new_array = ast.literal_eval(array_str)
-                if isinstance(new_array, list) and len(new_array) == len(self.array):
-                    self.array = new_array.copy()
-            except (ValueError, IndexError, SyntaxError):
-                # If parsing fails, ignore the update
-                pass
-
     def _handle_reset(self):
         """Reset all visual states."""
         self.comparing_indices.clear()
@@ -306,7 +383,7 @@ class VisualizationCanvas:
         self.draw_bars()
 
     def _handle_merge_actions(
-        self, action: str, indices: List[int], progress: float, is_final_frame: bool
+        self, action: str, indices: Sequence[int], progress: float, is_final_frame: bool
     ):
         """Handle merge sort and insertion sort specific actions."""
         if action == "divide":
@@ -349,36 +426,24 @@ class VisualizationCanvas:
         offset1 = (x2 - x1) * progress
         offset2 = (x1 - x2) * progress
 
-        # Clear and redraw with offsets
-        if self.bar_rects[idx1]:
-            self.canvas.delete(self.bar_rects[idx1])
-        if self.bar_texts[idx1]:
-            self.canvas.delete(self.bar_texts[idx1])
-        if self.bar_rects[idx2]:
-            self.canvas.delete(self.bar_rects[idx2])
-        if self.bar_texts[idx2]:
-            self.canvas.delete(self.bar_texts[idx2])
-
-        # Draw bars at interpolated positions
+        # Move the bars to their interpolated positions
         self._draw_single_bar(idx1, self.array[idx1], offset1)
         self._draw_single_bar(idx2, self.array[idx2], offset2)
 
-    def _redraw_affected_bars(self, indices: List[int]):
+    def _redraw_affected_bars(self, indices: Sequence[int]):
         """Redraw only the bars that were affected by the last action."""
         if not indices:
             # If no specific indices, redraw all
             self.draw_bars()
             return
 
+        if len(self.bar_rects) != len(self.array):
+            # The bars on screen no longer match the array; rebuild them
+            self.draw_bars()
+            return
+
         for idx in indices:
             if 0 <= idx < len(self.array):
-                # Delete old bar
-                if idx < len(self.bar_rects) and self.bar_rects[idx]:
-                    self.canvas.delete(self.bar_rects[idx])
-                if idx < len(self.bar_texts) and self.bar_texts[idx]:
-                    self.canvas.delete(self.bar_texts[idx])
-
-                # Draw new bar
                 self._draw_single_bar(idx, self.array[idx])
 
     def highlight_completion(self):
@@ -1,5 +1,16 @@
 import tkinter as tk
-from typing import List, Tuple, Callable, Dict, Any, Optional
+from time import monotonic
+from typing import (
+    List,
+    Tuple,
+    Callable,
+    Dict,
+    Any,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+)
 from .constants import (
     FRAME_INTERVAL_MS,
     INTERPOLATION_FRAMES,
@@ -8,6 +19,10 @@ from .constants import (
     ANIMATION_SPEED_MAX,
 )
 
+# Actions the canvas animates across a step's frames; every other action
+# only changes the display on the step's final frame
+_INTERPOLATED_ACTIONS = frozenset({"swap"})
+
 
 class AnimationController:
     """
@@ -32,29 +47,57 @@ class AnimationController:
         self.is_playing = False
         self.is_paused = False
         self.current_step = 0
-        self.animation_steps: List[Tuple[str, List[int], str]] = []
+        self.animation_steps: List[Tuple[str, Sequence[int], str]] = []
+        # Set instead of animation_steps when steps are streamed lazily
+        self.step_iterator: Optional[Iterator[Tuple[str, Sequence[int], str]]] = None
+        self.total_steps = 0
         self.speed = ANIMATION_SPEED_DEFAULT
 
         # Animation timing
         self.after_id: Optional[str] = None
+        # When the scheduled frame should run, to notice frames running late
+        self._frame_due = 0.0
         self.interpolation_frame = 0
+        # Frames the current step is drawn with; fewer at high speeds
+        self.step_frames = INTERPOLATION_FRAMES
         self.current_animation_data: Optional[Dict[str, Any]] = None
+        self.current_description: Optional[str] = None
+        self.current_step_data: Optional[Tuple[str, Sequence[int], str]] = None
+        self.current_array_state: Optional[List[int]] = None
 
         # Callbacks
         self.on_step_change: Optional[Callable[[int, str]]] = None
         self.on_completion: Optional[Callable] = None
+        self.on_error: Optional[Callable[[Exception], None]] = None
 
-    def set_steps(self, steps: List[Tuple[str, List[int], str]]):
+    def set_steps(
+        self,
+        steps: Iterable[Tuple[str, Sequence[int], str]],
+        estimated_total: Optional[int] = None,
+    ):
         """
         Set the animation steps to be executed.
 
         Args:
-            steps: List of animation steps from sorting algorithm
+            steps: List of animation steps from sorting algorithm, or an
+                iterator that produces them one at a time as they are played
+            estimated_total: Expected number of steps for an iterator, used
+                for progress until the iterator is exhausted
         """
-        self.animation_steps = steps
+        if isinstance(steps, list):
+            self.animation_steps = steps
+            self.step_iterator = None
+            self.total_steps = len(steps)
+        else:
+            self.animation_steps = []
+            self.step_iterator = iter(steps)
+            self.total_steps = estimated_total or 0
         self.current_step = 0
         self.interpolation_frame = 0
         self.current_animation_data = None
+        self.current_description = None
+        self.current_step_data = None
+        self.current_array_state = None
 
     def set_speed(self, speed: float):
         """
@@ -74,9 +117,27 @@ class AnimationController:
         """
         return int(FRAME_INTERVAL_MS / self.speed)
 
+    def get_step_frames(self) -> int:
+        """
+        Calculate how many frames a step is drawn with at the current speed.
+
+        Speeding up only shortens the frame interval, so from 2x on the
+        frames would come faster than the display refreshes. Those steps
+        are drawn with proportionally fewer frames instead; an animated
+        step keeps at least two, its first and final frame.
+
+        Returns:
+            Number of interpolation frames per step
+        """
+        return max(2, INTERPOLATION_FRAMES // max(1, round(self.speed)))
+
+    def _frame_delay(self) -> int:
+        """Milliseconds between frames, keeping a step's duration unchanged."""
+        return self.get_frame_interval() * INTERPOLATION_FRAMES // self.step_frames
+
     def play(self):
         """Start or resume animation."""
-        if not self.animation_steps:
+        if not self.animation_steps and self.step_iterator is None:
             return
 
         self.is_playing = True
@@ -98,6 +159,11 @@ class AnimationController:
         self.current_step = 0
         self.interpolation_frame = 0
         self.current_animation_data = None
+        self.current_description = None
+        self.current_step_data = None
+        self.current_array_state = None
+        # A stream cannot be rewound, so it has to be set again to replay
+        self.step_iterator = None
 
         if self.after_id:
             self.root.after_cancel(self.after_id)
@@ -119,9 +185,12 @@ class AnimationController:
         Get current progress.
 
         Returns:
-            Tuple of (current_step, total_steps)
+            Tuple of (current_step, total_steps); for streamed steps the
+            total is an estimate until all of them have been played
         """
-        return (self.current_step, len(self.animation_steps))
+        if self.step_iterator is None:
+            return (self.current_step, len(self.animation_steps))
+        return (self.current_step, max(self.total_steps, self.current_step))
 
     def set_step_callback(self, callback: Callable[[int, str], None]):
         """
@@ -141,12 +210,23 @@ class AnimationController:
         """
         self.on_completion = callback
 
+    def set_error_callback(self, callback: Callable[[Exception], None]):
+        """
+        Set callback for errors raised while producing streamed steps.
+
+        Args:
+            callback: Function called with the exception; playback has
+                already stopped when it runs
+        """
+        self.on_error = callback
+
     def _schedule_next_frame(self):
         """Schedule the next animation frame."""
         if not self.is_playing or self.is_paused:
             return
 
-        interval = self.get_frame_interval()
+        interval = self._frame_delay()
+        self._frame_due = monotonic() + interval / 1000
         self.after_id = self.root.after(interval, self._execute_frame)
 
     def _execute_frame(self):
@@ -154,15 +234,42 @@ class AnimationController:
         if not self.is_playing or self.is_paused:
             return
 
-        # Check if we've completed all steps
-        if self.current_step >= len(self.animation_steps):
-            self._complete_animation()
-            return
-
-        # Get current step
-        action, indices, description = self.animation_steps[self.current_step]
+        # Fetch the step once and keep it for all of its interpolation frames
+        if self.interpolation_frame == 0 or self.current_step_data is None:
+            try:
+                step = self._next_step()
+            except Exception as error:
+                # Streamed steps are generated here, inside an after()
+                # callback, so nothing up the stack can report the error
+                self.stop()
+                if self.on_error is None:
+                    raise
+                self.on_error(error)
+                return
+
+            # Check if we've completed all steps
+            if step is None:
+                self._complete_animation()
+                return
+
+            self.current_step_data = step
+            # Fix the frame count for the whole step, even if speed changes.
+            # Steps without in-between frames are drawn once and then held
+            # for as long as an animated step takes.
+            self.step_frames = (
+                self.get_step_frames() if step[0] in _INTERPOLATED_ACTIONS else 1
+            )
+            # Descriptions may be formatted lazily; build the text once per step
+            self.current_description = str(step[2])
+            # An array update carries the array's new state as a fourth item
+            self.current_array_state = step[3] if len(step) > 3 else None
+
+        action, indices = self.current_step_data[:2]
+        description = self.current_description
+
+        if 0 < self.interpolation_frame < self.step_frames - 1:
+            self._skip_late_frames()
 
-        # Handle interpolation for smooth animations
         if self.interpolation_frame == 0:
             # Start of new step - report correct step number
             if self.on_step_change:
@@ -170,7 +277,7 @@ class AnimationController:
                 self.on_step_change(step_number, description)
 
         # Calculate interpolation progress (0.0 to 1.0)
-        progress = self.interpolation_frame / INTERPOLATION_FRAMES
+        progress = self.interpolation_frame / self.step_frames
 
         # Create animation data with interpolation info
         animation_data = {
@@ -179,8 +286,10 @@ class AnimationController:
             "description": description,
             "progress": progress,
             "interpolation_frame": self.interpolation_frame,
-            "is_final_frame": self.interpolation_frame == INTERPOLATION_FRAMES - 1,
+            "is_final_frame": self.interpolation_frame == self.step_frames - 1,
         }
+        if self.current_array_state is not None:
+            animation_data["array_state"] = self.current_array_state
 
         # Call update callback
         if self.update_callback:
@@ -190,13 +299,45 @@ class AnimationController:
         self.interpolation_frame += 1
 
         # Check if we've completed this step's interpolation
-        if self.interpolation_frame >= INTERPOLATION_FRAMES:
+        if self.interpolation_frame >= self.step_frames:
             self.current_step += 1
             self.interpolation_frame = 0
 
         # Schedule next frame
         self._schedule_next_frame()
 
+    def _skip_late_frames(self):
+        """
+        Jump over in-between frames whose time has already passed.
+
+        At high speeds frames can be due faster than they are drawn; the
+        pure interpolation frames of a step are then dropped so the
+        animation catches up instead of drawing frames no one sees. The
+        first and final frame of a step always run, since they start and
+        commit its state.
+        """
+        interval = self._frame_delay() / 1000
+        if interval <= 0:
+            return
+        frames_behind = int((monotonic() - self._frame_due) / interval)
+        if frames_behind > 0:
+            self.interpolation_frame = min(
+                self.interpolation_frame + frames_behind, self.step_frames - 1
+            )
+
+    def _next_step(self) -> Optional[Tuple[str, Sequence[int], str]]:
+        """Return the step at current_step, or None once all steps are done."""
+        if self.step_iterator is None:
+            if self.current_step >= len(self.animation_steps):
+                return None
+            return self.animation_steps[self.current_step]
+
+        step = next(self.step_iterator, None)
+        if step is None:
+            # The stream is exhausted, so the real total is now known
+            self.total_steps = self.current_step
+        return step
+
     def _complete_animation(self):
         """Handle animation completion."""
         self.is_playing = False
@@ -204,8 +345,8 @@ class AnimationController:
         self.after_id = None
 
         # Ensure final step progress is reported correctly
-        if self.on_step_change and self.animation_steps:
-            total_steps = len(self.animation_steps)
+        _, total_steps = self.get_progress()
+        if self.on_step_change and total_steps:
             self.on_step_change(total_steps, "Animation completed")
 
         # Call completion callback
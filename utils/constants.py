@@ -1,5 +1,7 @@
 # Constants for the Sorting Visualizer Application
 
+from types import MappingProxyType
+
 # Window dimensions
 WINDOW_WIDTH = 1200
 WINDOW_HEIGHT = 800
@@ -10,18 +12,20 @@ VISUALIZATION_CANVAS_WIDTH = 700
 LEGEND_PANEL_WIDTH = 130
 CANVAS_HEIGHT = 400
 
-# Colors
-COLORS = {
-    "DEFAULT": "#3498DB",  # Blue - unsorted bars
-    "COMPARING": "#F39C12",  # Orange - bars being compared
-    "SWAPPING": "#E74C3C",  # Red - bars being swapped
-    "SORTED": "#27AE60",  # Green - sorted bars
-    "BACKGROUND": "#2C3E50",  # Dark blue-gray background
-    "PANEL_BG": "#34495E",  # Slightly lighter panel background
-    "TEXT": "#FFFFFF",  # White text
-    "ERROR": "#E74C3C",  # Red error text
-    "SUCCESS": "#27AE60",  # Green success text
-}
+# Colors; read-only, so code may look a color up once and keep it
+COLORS = MappingProxyType(
+    {
+        "DEFAULT": "#3498DB",  # Blue - unsorted bars
+        "COMPARING": "#F39C12",  # Orange - bars being compared
+        "SWAPPING": "#E74C3C",  # Red - bars being swapped
+        "SORTED": "#27AE60",  # Green - sorted bars
+        "BACKGROUND": "#2C3E50",  # Dark blue-gray background
+        "PANEL_BG": "#34495E",  # Slightly lighter panel background
+        "TEXT": "#FFFFFF",  # White text
+        "ERROR": "#E74C3C",  # Red error text
+        "SUCCESS": "#27AE60",  # Green success text
+    }
+)
 
 # Animation settings
 ANIMATION_SPEED_DEFAULT = 1.0
@@ -31,6 +35,13 @@ FPS_TARGET = 60
 FRAME_INTERVAL_MS = 16  # 1000ms / 60fps ≈ 16ms
 INTERPOLATION_FRAMES = 8
 
+# Slider drags fire on every step; only act once they settle for this long
+SIZE_DEBOUNCE_MS = 60
+SPEED_DEBOUNCE_MS = 30
+
+# Step descriptions change faster than they can be read; cap label updates
+OPERATION_UPDATE_MS = 33  # about 30 per second
+
 # Array settings
 ARRAY_SIZE_DEFAULT = 25
 ARRAY_SIZE_MIN = 10
@@ -72,24 +83,26 @@ ALGORITHM_INFO = {
     "Merge Sort": {
         "time_complexity": "O(n log n)",
         "space_complexity": "O(n)",
-        "description": "Divides array into halves, sorts them, then merges back together.",
+        "description": "Merges runs that are already in order, pair by pair, until one is left.",
     },
     "Quick Sort": {
         "time_complexity": "O(n log n)",
         "space_complexity": "O(log n)",
-        "description": "Partitions array around a pivot, then sorts partitions recursively.",
+        "description": "Partitions around a median-of-three pivot; small parts use insertion sort.",
     },
 }
 
 # Error messages
-ERROR_MESSAGES = {
-    "EMPTY_INPUT": "Please enter at least one number.",
-    "INVALID_FORMAT": "Please enter comma-separated integers only.",
-    "OUT_OF_RANGE": f"Numbers must be between {VALUE_MIN} and {VALUE_MAX}.",
-    "TOO_MANY_ELEMENTS": f"Maximum {ARRAY_SIZE_MAX} elements allowed.",
-    "INVALID_NUMBER": "Invalid number format detected.",
-    "NO_ALGORITHM": "Please select an algorithm first.",
-}
+ERROR_MESSAGES = MappingProxyType(
+    {
+        "EMPTY_INPUT": "Please enter at least one number.",
+        "INVALID_FORMAT": "Please enter comma-separated integers only.",
+        "OUT_OF_RANGE": f"Numbers must be between {VALUE_MIN} and {VALUE_MAX}.",
+        "TOO_MANY_ELEMENTS": f"Maximum {ARRAY_SIZE_MAX} elements allowed.",
+        "INVALID_NUMBER": "Invalid number format detected.",
+        "NO_ALGORITHM": "Please select an algorithm first.",
+    }
+)
 
 # Button symbols and text
 BUTTON_SYMBOLS = {"PLAY": "▶", "PAUSE": "⏸", "RESET": "⟲"}
@@ -1,6 +1,13 @@
 import re
+from functools import lru_cache
 from typing import List, Optional, Tuple
-from .constants import VALUE_MIN, VALUE_MAX, ARRAY_SIZE_MAX, ERROR_MESSAGES
+from .constants import (
+    VALUE_MIN,
+    VALUE_MAX,
+    ARRAY_SIZE_MIN,
+    ARRAY_SIZE_MAX,
+    ERROR_MESSAGES,
+)
 
 
 class InputValidator:
@@ -10,6 +17,9 @@ class InputValidator:
     Validates comma-separated integers within specified range and count limits.
     """
 
+    # Optional minus sign followed by digits; compiled once at import
+    _INT_RE = re.compile(r"^-?\d+$")
+
     @staticmethod
     def validate_input(
         input_text: str,
@@ -26,49 +36,11 @@ class InputValidator:
             - parsed_numbers: List of integers if valid, None if invalid
             - error_message: Error description if invalid, None if valid
         """
-
-        # Remove whitespace and check for empty input
-        input_text = input_text.strip()
-        if not input_text:
-            return False, None, ERROR_MESSAGES["EMPTY_INPUT"]
-
-        # Remove trailing comma if present
-        if input_text.endswith(","):
-            input_text = input_text[:-1]
-
-        # Split by comma and clean each part
-        parts = [part.strip() for part in input_text.split(",")]
-
-        # Remove empty parts (handles double commas, etc.)
-        parts = [part for part in parts if part]
-
-        if not parts:
-            return False, None, ERROR_MESSAGES["EMPTY_INPUT"]
-
-        # Check number of elements
-        if len(parts) > ARRAY_SIZE_MAX:
-            return False, None, ERROR_MESSAGES["TOO_MANY_ELEMENTS"]
-
-        numbers = []
-
-        for part in parts:
-            # Check if part is a valid integer
-            if not InputValidator._is_valid_integer(part):
-                return False, None, ERROR_MESSAGES["INVALID_NUMBER"]
-
-            try:
-                num = int(part)
-
-                # Check range
-                if num < VALUE_MIN or num > VALUE_MAX:
-                    return False, None, ERROR_MESSAGES["OUT_OF_RANGE"]
-
-                numbers.append(num)
-
-            except ValueError:
-                return False, None, ERROR_MESSAGES["INVALID_NUMBER"]
-
-        return True, numbers, None
+        # The same text is validated again and again as the user edits it,
+        # so results are cached; hand out a fresh list each time since the
+        # caller owns the parsed numbers
+        is_valid, numbers, error = _validate_cached(input_text)
+        return is_valid, list(numbers) if numbers is not None else None, error
 
     @staticmethod
     def _is_valid_integer(text: str) -> bool:
@@ -81,9 +53,11 @@ class InputValidator:
         Returns:
             True if text is a valid integer format
         """
-        # Allow optional minus sign followed by digits
-        pattern = r"^-?\d+$"
-        return bool(re.match(pattern, text))
+        # Plain digit strings are the usual case; isdecimal() accepts exactly
+        # what \d does and skips the regex engine, which is left for the sign
+        if text.isdecimal():
+            return True
+        return InputValidator._INT_RE.match(text) is not None
 
     @staticmethod
     def format_input(numbers: List[int]) -> str:
@@ -109,8 +83,6 @@ class InputValidator:
         Returns:
             True if size is valid
         """
-        from .constants import ARRAY_SIZE_MIN, ARRAY_SIZE_MAX
-
         return ARRAY_SIZE_MIN <= size <= ARRAY_SIZE_MAX
 
     @staticmethod
@@ -129,3 +101,52 @@ class InputValidator:
         max_val = max(numbers)
 
         return f"Array of {count} elements (range: {min_val}-{max_val})"
+
+
+@lru_cache(maxsize=256)
+def _validate_cached(
+    input_text: str,
+) -> Tuple[bool, Optional[Tuple[int, ...]], Optional[str]]:
+    """Validate one input string; numbers come back as an immutable tuple."""
+    numbers = []
+    error = None
+    count = 0
+
+    # One pass over the comma-separated parts. Empty parts (trailing or
+    # double commas) are skipped, and once a part is invalid the rest are
+    # only counted so an oversized input still reports its size first.
+    for part in input_text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+
+        count += 1
+        if count > ARRAY_SIZE_MAX:
+            return False, None, ERROR_MESSAGES["TOO_MANY_ELEMENTS"]
+        if error is not None:
+            continue
+
+        # Check if part is a valid integer
+        if not InputValidator._is_valid_integer(part):
+            error = ERROR_MESSAGES["INVALID_NUMBER"]
+            continue
+
+        try:
+            num = int(part)
+        except ValueError:
+            error = ERROR_MESSAGES["INVALID_NUMBER"]
+            continue
+
+        # Check range
+        if num < VALUE_MIN or num > VALUE_MAX:
+            error = ERROR_MESSAGES["OUT_OF_RANGE"]
+            continue
+
+        numbers.append(num)
+
+    if not count:
+        return False, None, ERROR_MESSAGES["EMPTY_INPUT"]
+    if error is not None:
+        return False, None, error
+
+    return True, tuple(numbers), None